@@ -13,6 +13,9 @@ import streamlit as st
 import json
 from pathlib import Path
 
+# Install the NLTK pos_tag patch before any analysis tool imports nltk.tag
+import utils.nltk_patches  # noqa: F401  # installs the pos_tag patch on import
+
 # Import UI components
 from ui_components.header import render_header
 from ui_components.sidebar import render_sidebar
@@ -38,11 +41,15 @@ st.set_page_config(
 )
 
 # Apply custom CSS
+@st.cache_data
+def _read_css():
+    """Read the app stylesheet once; it only changes on redeploy"""
+    css_path = Path(__file__).parent / "assets" / "styles.css"
+    return f"<style>{css_path.read_text()}</style>"
+
 def load_css():
     """Load custom CSS from the assets directory"""
-    css_path = Path(__file__).parent / "assets" / "styles.css"
-    with open(css_path, "r") as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+    st.markdown(_read_css(), unsafe_allow_html=True)
     
     # Load Font Awesome for consistent icons
     st.markdown(
@@ -84,8 +91,8 @@ def main():
     except Exception as e:
         st.error(f"Error loading metrics: {str(e)}")
     
-    # 1. Render the sidebar
-    sidebar_options = render_sidebar()
+    # 1. Render the sidebar; its settings live in st.session_state (use_langchain_toggle)
+    render_sidebar()
 
     # 2. Render the header
     render_header()
@@ -0,0 +1,61 @@
+"""
+Test NLTK Patches - DeFacture Application
+=========================================
+
+This test validates the memoized pos_tag wrapper installed by
+utils/nltk_patches.py.
+"""
+
+import pytest
+
+from utils import nltk_patches
+from utils.nltk_patches import patched_pos_tag
+
+TOKENS = ["Alice", "visited", "Paris", "yesterday"]
+EXPECTED = [("Alice", "NNP"), ("visited", "NN"), ("Paris", "NNP"), ("yesterday", "NN")]
+
+
+@pytest.fixture
+def tagger_calls(monkeypatch):
+    """Route tagging through the heuristic fallback and record each real tagging call"""
+    calls = []
+
+    def counting_tagger(tokens, tagset=None):
+        calls.append(list(tokens))
+        return nltk_patches._fallback_pos_tag(tokens, tagset)
+
+    monkeypatch.setattr(nltk_patches, "_dispatch", counting_tagger)
+    patched_pos_tag.cache_clear()
+    yield calls
+    # Don't leave fallback results behind for other tests
+    patched_pos_tag.cache_clear()
+
+
+def test_cache_hit_returns_equal_list(tagger_calls):
+    """A repeated token sequence is served from the cache as an equal list"""
+    first = patched_pos_tag(TOKENS)
+    second = patched_pos_tag(list(TOKENS))
+
+    assert first == EXPECTED
+    assert second == first
+    assert isinstance(second, list)
+    assert len(tagger_calls) == 1
+
+
+def test_mutating_result_does_not_change_next_hit(tagger_calls):
+    """Callers get a fresh list, so mutating it can't corrupt the cached entry"""
+    first = patched_pos_tag(TOKENS)
+    first.append(("extra", "NN"))
+    first[0] = ("Alice", "XX")
+
+    assert patched_pos_tag(TOKENS) == EXPECTED
+    assert len(tagger_calls) == 1
+
+
+def test_cache_clear_resets_cache(tagger_calls):
+    """cache_clear() forces the next call to tag again"""
+    patched_pos_tag(TOKENS)
+    patched_pos_tag.cache_clear()
+    assert patched_pos_tag(TOKENS) == EXPECTED
+
+    assert len(tagger_calls) == 2
@@ -2,15 +2,17 @@
 """Test script for sample article mock analysis"""
 
 from tools.analysis import *
-from ui_components.ui_helpers import SAMPLE_ARTICLES
+from ui_components.ui_helpers import get_sample_articles
 
 def test_sample_analysis():
     """Test all mock analysis functions with sample articles"""
     
+    sample_articles = get_sample_articles()
+    
     print("🧪 Testing Sample Articles Mock Analysis")
     print("=" * 50)
     
-    for i, article in enumerate(SAMPLE_ARTICLES):
+    for i, article in enumerate(sample_articles):
         print(f"\n📰 Testing Article {i+1}: {article['title'][:50]}...")
         
         # Test Summary
@@ -43,7 +45,7 @@ def test_sample_analysis():
         except Exception as e:
             print(f"   ✅ Fact Check: ❌ Error - {e}")
     
-    print(f"\n🎉 Testing Complete! All {len(SAMPLE_ARTICLES)} sample articles tested.")
+    print(f"\n🎉 Testing Complete! All {len(sample_articles)} sample articles tested.")
 
 if __name__ == "__main__":
     test_sample_analysis()
\ No newline at end of file
@@ -12,28 +12,8 @@ import logging
 from typing import List, Dict
 import nltk
 
-# Import NLTK patches - Handle patching here explicitly instead of relying on external module
-import sys
-import os
-from nltk.tag import pos_tag as original_pos_tag
-
-def _patched_pos_tag(tokens, tagset=None, lang='eng'):
-    """Custom POS tagging function that doesn't rely on problematic resources"""
-    try:
-        return original_pos_tag(tokens, tagset=tagset)
-    except LookupError:
-        # Simple fallback for POS tagging without NLTK resources
-        result = []
-        for token in tokens:
-            # Simple heuristic for proper nouns: capitalized words
-            if token and len(token) > 0 and token[0].isupper() and token.isalpha():
-                result.append((token, 'NNP'))  # Proper noun
-            else:
-                result.append((token, 'NN'))   # Regular noun
-        return result
-
-# Apply the monkey patch directly
-nltk.tag.pos_tag = _patched_pos_tag
+# Install the shared pos_tag patch (tagger probe, heuristic fallback, memoized results)
+import utils.nltk_patches as nltk_patches
 from nltk.tokenize import sent_tokenize
 from nltk.tokenize import word_tokenize
 from nltk.tag import pos_tag
@@ -76,6 +56,8 @@ def _ensure_nltk_data():
             nltk.download('words', quiet=True)
             nltk.download('stopwords', quiet=True)
             logger.info("NLTK data downloaded successfully")
+            # Let the pos_tag patch pick up a tagger that was just installed
+            nltk_patches.refresh_tagger()
             return True
             
         except Exception as e:
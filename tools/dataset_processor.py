@@ -111,14 +111,14 @@ def validate_json_dataset(file_content: str) -> Dict[str, Union[bool, str, List]
             "articles": []
         }
 
-def process_jsonl_dataset(file_content: str) -> Dict[str, Union[bool, str, List]]:
+def process_jsonl_dataset(file_content: Union[str, bytes]) -> Dict[str, Union[bool, str, List]]:
     """
     Process JSONL (JSON Lines) dataset
     
     Parameters:
     -----------
-    file_content : str
-        Raw content of the uploaded JSONL file
+    file_content : str or bytes
+        Raw content of the uploaded JSONL file; bytes are parsed without decoding first
         
     Returns:
     --------
@@ -126,7 +126,14 @@ def process_jsonl_dataset(file_content: str) -> Dict[str, Union[bool, str, List]
         Processing result with status, message, and parsed articles
     """
     try:
-        lines = file_content.strip().split('\n')
+        # bytes.splitlines() only breaks on \n, \r\n and \r, which JSON never allows
+        # unescaped inside a value; str.splitlines() also breaks on U+2028, \x85
+        # etc., which JSON strings may contain, so text input is split on '\n' only
+        # (a trailing '\r' is whitespace to json.loads)
+        if isinstance(file_content, bytes):
+            lines = file_content.splitlines()
+        else:
+            lines = file_content.split('\n')
         valid_articles = []
         
         for i, line in enumerate(lines):
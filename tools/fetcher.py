@@ -7,94 +7,22 @@ This module contains functions for fetching articles from URLs using newspaper3k
 from newspaper import Article
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import re
 
-def fetch_article_with_newspaper(url: str) -> dict:
+@st.cache_resource
+def get_http_session() -> requests.Session:
     """
-    Fetches article using newspaper3k.
-    Returns dict with success flag, title, authors, publish_date, and content.
+    Shared requests.Session so repeat fetches reuse pooled TCP/TLS connections.
+    Created once per server process and shared across reruns and sessions.
     """
-    try:
-        article = Article(url)
-        article.download()
-        article.parse()
-        
-        # Extract domain from URL
-        from urllib.parse import urlparse
-        domain = urlparse(url).netloc
-
-        # Clean and validate content
-        content = article.text.strip() if article.text else ""
-        
-        # Basic content validation - check if we got meaningful content
-        if len(content) < 50:
-            # Try fallback method
-            fallback_result = fetch_article_fallback(url)
-            if fallback_result["success"]:
-                return fallback_result
-            
-            return {
-                "success": False,
-                "error": f"Article content too short ({len(content)} characters). This might be due to paywall or extraction issues.",
-                "title": article.title,
-                "content": content,
-                "authors": article.authors,
-                "publish_date": article.publish_date,
-                "domain": domain
-            }
-        
-        # Check for common extraction issues (navigation menus, etc.)
-        problematic_phrases = [
-            "see all topics follow",
-            "subscribe now",
-            "menu items",
-            "navigation",
-            "social media",
-            "follow us"
-        ]
-        
-        content_lower = content.lower()
-        if any(phrase in content_lower for phrase in problematic_phrases) and len(content) < 200:
-            # Try fallback method
-            fallback_result = fetch_article_fallback(url)
-            if fallback_result["success"]:
-                return fallback_result
-            
-            return {
-                "success": False,
-                "error": "Extracted content appears to contain navigation elements rather than article text. The website might use dynamic loading or have anti-scraping measures.",
-                "title": article.title,
-                "content": content,
-                "authors": article.authors,
-                "publish_date": article.publish_date,
-                "domain": domain
-            }
-
-        return {
-            "success": True,
-            "source": "url",
-            "title": article.title,
-            "content": content,
-            "authors": article.authors,
-            "publish_date": article.publish_date,
-            "domain": domain
-        }
-    except Exception as e:
-        # Try fallback method
-        fallback_result = fetch_article_fallback(url)
-        if fallback_result["success"]:
-            return fallback_result
-            
-        return {
-            "success": False,
-            "error": str(e),
-            "title": None,
-            "content": None,
-            "authors": [],
-            "publish_date": None,
-            "domain": None
-        }
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    return session
 
 def fetch_article_fallback(url: str) -> dict:
     """
@@ -105,11 +33,7 @@ def fetch_article_fallback(url: str) -> dict:
         from urllib.parse import urlparse
         domain = urlparse(url).netloc
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_http_session().get(url, timeout=10)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.content, 'html.parser')
@@ -188,7 +112,11 @@ def fetch_article_with_newspaper(url: str) -> dict:
     """
     try:
         article = Article(url)
-        article.download()
+        # Download through the pooled session so repeat fetches reuse the host's
+        # connection; newspaper then only parses the HTML it is handed
+        response = get_http_session().get(url, timeout=10)
+        response.raise_for_status()
+        article.download(input_html=response.text)
         article.parse()
         
         # Extract domain from URL
@@ -200,6 +128,11 @@ def fetch_article_with_newspaper(url: str) -> dict:
         
         # Basic content validation - check if we got meaningful content
         if len(content) < 50:
+            # Try fallback method
+            fallback_result = fetch_article_fallback(url)
+            if fallback_result["success"]:
+                return fallback_result
+            
             return {
                 "success": False,
                 "error": f"Article content too short ({len(content)} characters). This might be due to paywall or extraction issues.",
@@ -222,6 +155,11 @@ def fetch_article_with_newspaper(url: str) -> dict:
         
         content_lower = content.lower()
         if any(phrase in content_lower for phrase in problematic_phrases) and len(content) < 200:
+            # Try fallback method
+            fallback_result = fetch_article_fallback(url)
+            if fallback_result["success"]:
+                return fallback_result
+            
             return {
                 "success": False,
                 "error": "Extracted content appears to contain navigation elements rather than article text. The website might use dynamic loading or have anti-scraping measures.",
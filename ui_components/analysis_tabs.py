@@ -10,6 +10,7 @@ This module contains the code for the analysis tabs section of the application:
 
 import streamlit as st
 import logging
+import re
 from tools.analysis import (
     mock_summarization_chain,
     real_summarization_chain,
@@ -26,6 +27,131 @@ from config.config import USE_LANGCHAIN_API
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# HTML escaping for user/article text embedded in cards. Equivalent to
+# html.escape(s, quote=True), but clean strings (the common case for news
+# titles, sources and claims) are returned untouched after a single scan.
+_HTML_NEEDS = re.compile('[&<>"\']')
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+
+def _esc(s):
+    """Escape HTML special characters, skipping the copy when there are none"""
+    if not s:
+        return ''
+    if _HTML_NEEDS.search(s) is None:
+        return s
+    return s.translate(_HTML_ESCAPE_TABLE)
+
+# Card color schemes, looked up per item instead of rebuilt as dicts
+# Key points cycle through (bg, shadow)
+_KEY_POINT_SCHEMES = (
+    ("#234e52", "rgba(35, 78, 82, 0.15)"),
+    ("#4169e1", "rgba(65, 105, 225, 0.15)"),
+    ("#38b2ac", "rgba(56, 178, 172, 0.15)"),
+    ("#2563eb", "rgba(37, 99, 235, 0.15)"),
+    ("#1e293b", "rgba(30, 41, 59, 0.15)"),
+)
+# Extracted claims by confidence band: (bg, shadow, confidence_color)
+_CONFIDENCE_SCHEMES = (
+    ("#38b2ac", "rgba(56, 178, 172, 0.2)", "#059669"),
+    ("#4169e1", "rgba(65, 105, 225, 0.2)", "#2563eb"),
+    ("#f59e0b", "rgba(245, 158, 11, 0.2)", "#d97706"),
+)
+# Sample article assessments: (bg, emoji, shadow, verdict_bg, verdict_color)
+_ASSESSMENT_SCHEMES = {
+    'Accurate': ('#10b981', '✅', 'rgba(16, 185, 129, 0.2)', '#d1fae5', '#065f46'),
+    'Partially Accurate': ('#f59e0b', '⚠️', 'rgba(245, 158, 11, 0.2)', '#fef3c7', '#92400e'),
+    'False': ('#ef4444', '❌', 'rgba(239, 68, 68, 0.2)', '#fee2e2', '#991b1b'),
+}
+
+# Fact-check verdict card. Colors are baked in per verdict at import time,
+# leaving only {i}, {verdict}, {claim} and {justification} for each claim.
+_VERDICT_CARD_TPL = (
+    '<div style="background: linear-gradient(120deg, rgba(255, 255, 255, 0.92) 0%, rgba(255,240,245,0.88) 100%); backdrop-filter: blur(15px); border: 1px solid rgba(255,240,245,0.5); border-radius: 16px; padding: 1.4rem; margin-bottom: 1rem; box-shadow: 0 6px 20px {shadow}; position: relative; border-left: 4px solid {bg};">'
+    '<div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 1rem;">'
+    '<div style="background: {bg}; color: white; border-radius: 20px; padding: 0.3rem 0.8rem; font-size: 0.8rem; font-weight: bold;">Claim #{{i}}</div>'
+    '<div style="display: flex; align-items: center; gap: 0.5rem;">'
+    '<span style="font-size: 0.9rem;">{emoji}</span>'
+    '<div style="background: {verdict_bg}; color: {verdict_color}; border-radius: 20px; padding: 0.3rem 0.8rem; font-size: 0.8rem; font-weight: bold;">{{verdict}}</div>'
+    '</div>'
+    '</div>'
+    '<div style="padding: 0.5rem 0; margin-bottom: 1rem;">'
+    '<p style="color: #1a202c; font-size: 1rem; line-height: 1.6; margin: 0; text-align: justify; font-family: \'Inter\', \'Segoe UI\', sans-serif; font-weight: 500;">{{claim}}</p>'
+    '</div>'
+    '<div style="background: rgba(255, 255, 255, 0.6); border-radius: 8px; padding: 1rem; border: 1px solid rgba(0, 0, 0, 0.05);">'
+    '<p style="color: #6b7280; font-size: 0.9rem; line-height: 1.5; margin: 0; font-style: italic; font-family: \'Inter\', \'Segoe UI\', sans-serif;"><strong>Justification:</strong> {{justification}}</p>'
+    '</div>'
+    '</div>'
+)
+_TEMPLATE_TRUE = _VERDICT_CARD_TPL.format(
+    bg="#059669", shadow="rgba(5, 150, 105, 0.2)", verdict_bg="#dcfce7", verdict_color="#059669", emoji="🟢"
+)
+_TEMPLATE_PARTIAL = _VERDICT_CARD_TPL.format(
+    bg="#d97706", shadow="rgba(217, 119, 6, 0.2)", verdict_bg="#fef3c7", verdict_color="#d97706", emoji="🟡"
+)
+_TEMPLATE_FALSE = _VERDICT_CARD_TPL.format(
+    bg="#dc2626", shadow="rgba(220, 38, 38, 0.2)", verdict_bg="#fee2e2", verdict_color="#dc2626", emoji="🔴"
+)
+_VERDICT_TEMPLATES = {
+    "Accurate": _TEMPLATE_TRUE,
+    "Partially Accurate": _TEMPLATE_PARTIAL,
+}
+
+# Single stat card; filled with (gradient, value color, value, label color, label)
+_STAT_TPL = (
+    '<div style="flex: 1; background: linear-gradient(120deg, %s); border-radius: 12px; padding: 1rem; text-align: center; box-shadow: 0 2px 8px rgba(180,180,200,0.1);">'
+    '<h4 style="color: %s; margin: 0; font-size: {value_size};">%s</h4>'
+    '<p style="color: %s; margin: 0; font-size: {label_size};">%s</p>'
+    '</div>'
+)
+
+
+def _render_stat_row(stats_rows, value_size="1.5rem", label_size="0.9rem"):
+    """
+    Renders a row of statistic cards with a single st.markdown call
+    
+    Parameters:
+    -----------
+    stats_rows : list of tuple
+        (gradient, value_color, value, label_color, label) for each card
+    value_size : str
+        CSS font size for the values
+    label_size : str
+        CSS font size for the labels
+    """
+    card_tpl = _STAT_TPL.format(value_size=value_size, label_size=label_size)
+    st.markdown(
+        '<div style="display: flex; gap: 1rem; margin: 1rem 0;">' +
+        ''.join(card_tpl % row for row in stats_rows) +
+        '</div>',
+        unsafe_allow_html=True
+    )
+
+# Claims rendered up front; the rest go into an expander to keep first paint small
+_EAGER_CLAIM_LIMIT = 20
+
+
+def _render_claim_cards(cards):
+    """
+    Renders pre-built claim card HTML, batching each group into one st.markdown call
+    
+    Parameters:
+    -----------
+    cards : list of str
+        Card HTML fragments in display order
+    """
+    st.markdown("<div>" + "".join(cards[:_EAGER_CLAIM_LIMIT]) + "</div>", unsafe_allow_html=True)
+    remaining = len(cards) - _EAGER_CLAIM_LIMIT
+    if remaining > 0:
+        with st.expander(f"Show {remaining} more claims"):
+            st.markdown("<div>" + "".join(cards[_EAGER_CLAIM_LIMIT:]) + "</div>", unsafe_allow_html=True)
+
 def render_analysis_tabs(article_data=None):
     """
     Renders the analysis tabs section
@@ -121,8 +247,7 @@ def render_analysis_tabs(article_data=None):
         )
         
         # Summary content box - escape HTML content
-        import html
-        escaped_summary = html.escape(summary_result.get('summary', 'No summary available.'))
+        escaped_summary = _esc(summary_result.get('summary', 'No summary available.'))
         st.markdown(
             f"""
             <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.92) 0%, rgba(227, 240, 252, 0.88) 100%); 
@@ -193,35 +318,28 @@ def render_analysis_tabs(article_data=None):
                 unsafe_allow_html=True
             )
             
-            # Individual key point cards with sophisticated styling
+            # Individual key point cards with sophisticated styling, emitted as one block
+            point_cards = []
             for i, point in enumerate(summary_result["key_points"], 1):
                 # Sophisticated color schemes matching the app
-                colors = [
-                    {"bg": "#234e52", "shadow": "rgba(35, 78, 82, 0.15)", "accent": "#38b2ac"},
-                    {"bg": "#4169e1", "shadow": "rgba(65, 105, 225, 0.15)", "accent": "#4682b4"}, 
-                    {"bg": "#38b2ac", "shadow": "rgba(56, 178, 172, 0.15)", "accent": "#234e52"},
-                    {"bg": "#2563eb", "shadow": "rgba(37, 99, 235, 0.15)", "accent": "#1e293b"},
-                    {"bg": "#1e293b", "shadow": "rgba(30, 41, 59, 0.15)", "accent": "#38b2ac"}
-                ]
-                color_scheme = colors[(i-1) % len(colors)]
+                bg, shadow = _KEY_POINT_SCHEMES[(i-1) % len(_KEY_POINT_SCHEMES)]
                 
                 # Escape HTML content for key points
-                escaped_point = html.escape(point)
-                st.markdown(
-                    f"""
-                    <div style="background: linear-gradient(120deg, rgba(255, 255, 255, 0.92) 0%, rgba(227,240,252,0.88) 100%); 
+                escaped_point = _esc(point)
+                point_cards.append(
+                    f"""<div style="background: linear-gradient(120deg, rgba(255, 255, 255, 0.92) 0%, rgba(227,240,252,0.88) 100%); 
                                 backdrop-filter: blur(15px); 
                                 border: 1px solid rgba(227,240,252,0.5); 
                                 border-radius: 16px; 
                                 padding: 1.4rem; 
                                 margin-bottom: 1rem; 
-                                box-shadow: 0 6px 20px {color_scheme['shadow']}; 
+                                box-shadow: 0 6px 20px {shadow}; 
                                 position: relative; 
-                                border-left: 4px solid {color_scheme['bg']};">
+                                border-left: 4px solid {bg};">
                         <div style="position: absolute; 
                                     top: -8px; 
                                     left: 15px; 
-                                    background: {color_scheme['bg']}; 
+                                    background: {bg}; 
                                     color: white; 
                                     border-radius: 50%; 
                                     width: 28px; 
@@ -231,7 +349,7 @@ def render_analysis_tabs(article_data=None):
                                     justify-content: center; 
                                     font-size: 0.85rem; 
                                     font-weight: bold; 
-                                    box-shadow: 0 2px 8px {color_scheme['shadow']};">
+                                    box-shadow: 0 2px 8px {shadow};">
                             {i}
                         </div>
                         <div style="margin-top: 0.5rem; padding-left: 0.5rem;">
@@ -245,10 +363,9 @@ def render_analysis_tabs(article_data=None):
                                 {escaped_point}
                             </p>
                         </div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True
+                    </div>"""
                 )
+            st.markdown("<div>" + "".join(point_cards) + "</div>", unsafe_allow_html=True)
 
     # Context Analysis tab
     with tab_context:
@@ -284,17 +401,21 @@ def render_analysis_tabs(article_data=None):
                  "desc": "Uses mock data (no model, for testing only)"}
             ]
             
+            # Index the options by id once so label/description lookups are O(1)
+            options_by_id = {opt["id"]: opt for opt in model_options}
+            model_ids = list(options_by_id)
+            
             # Create radio buttons with descriptions
             selected_option = st.radio(
                 "Context Analysis Model",
-                options=[opt["id"] for opt in model_options],
-                format_func=lambda x: next((opt["name"] for opt in model_options if opt["id"] == x), x),
-                index=[opt["id"] for opt in model_options].index(st.session_state.context_tab_model),
+                options=model_ids,
+                format_func=lambda x: options_by_id[x]["name"] if x in options_by_id else x,
+                index=model_ids.index(st.session_state.context_tab_model),
                 help="Select the model to use for context analysis"
             )
             
             # Show description for selected model
-            selected_desc = next((opt["desc"] for opt in model_options if opt["id"] == selected_option), "")
+            selected_desc = options_by_id[selected_option]["desc"] if selected_option in options_by_id else ""
             st.caption(selected_desc)
             
             # Update session state
@@ -430,8 +551,7 @@ def render_analysis_tabs(article_data=None):
             st.write("")
         
         # Perspective
-        import html
-        escaped_perspective = html.escape(context_result.get('perspective', 'No perspective analysis available.'))
+        escaped_perspective = _esc(context_result.get('perspective', 'No perspective analysis available.'))
         st.markdown(
             f"""
             <div style="background: rgba(255,255,255,0.9); border-radius: 15px; padding: 1.5rem; margin-bottom: 1rem; box-shadow: 0 4px 20px rgba(0,0,0,0.05); border-left: 4px solid #38b2ac;">
@@ -455,21 +575,20 @@ def render_analysis_tabs(article_data=None):
                 """,
                 unsafe_allow_html=True
             )
-            for indicator in bias_indicators:
-                escaped_indicator = html.escape(indicator)
-                st.markdown(
-                    f"""
-                    <div style="background: rgba(255,255,255,0.9); border-radius: 10px; padding: 1rem; margin-bottom: 0.5rem; box-shadow: 0 2px 10px rgba(0,0,0,0.03); border-left: 3px solid #fbb6ce;">
-                        <p style="color: #4a5568; line-height: 1.5; margin: 0; font-size: 0.9rem;">• {escaped_indicator}</p>
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
+            st.markdown(
+                "<div>" + "".join(
+                    '<div style="background: rgba(255,255,255,0.9); border-radius: 10px; padding: 1rem; margin-bottom: 0.5rem; box-shadow: 0 2px 10px rgba(0,0,0,0.03); border-left: 3px solid #fbb6ce;">'
+                    f'<p style="color: #4a5568; line-height: 1.5; margin: 0; font-size: 0.9rem;">• {_esc(indicator)}</p>'
+                    '</div>'
+                    for indicator in bias_indicators
+                ) + "</div>",
+                unsafe_allow_html=True
+            )
         
         # Historical Context
         historical_context = context_result.get('historical_context', '')
         if historical_context:
-            escaped_historical = html.escape(historical_context)
+            escaped_historical = _esc(historical_context)
             st.markdown(
                 f"""
                 <div style="background: rgba(255,255,255,0.9); border-radius: 15px; padding: 1.5rem; margin: 1.5rem 0 1rem 0; box-shadow: 0 4px 20px rgba(0,0,0,0.05); border-left: 4px solid #9f7aea;">
@@ -485,7 +604,7 @@ def render_analysis_tabs(article_data=None):
         # Missing Context
         missing_context = context_result.get('missing_context', '')
         if missing_context:
-            escaped_missing = html.escape(missing_context)
+            escaped_missing = _esc(missing_context)
             st.markdown(
                 f"""
                 <div style="background: rgba(255,255,255,0.9); border-radius: 15px; padding: 1.5rem; margin: 1rem 0; box-shadow: 0 4px 20px rgba(0,0,0,0.05); border-left: 4px solid #ed8936;">
@@ -622,14 +741,16 @@ def render_analysis_tabs(article_data=None):
                     perspective_color = '#6366f1'
                     perspective_icon = '🔄'
                 
-                import html
-                escaped_title = html.escape(article.get('title', 'Untitled'))
-                escaped_source = html.escape(article.get('source', 'Unknown Source'))
-                escaped_url = html.escape(article.get('url', '#'))
-                
-                # Get explanation if available
-                explanation = article.get('explanation', '')
-                escaped_explanation = html.escape(explanation) if explanation else ''
+                # Escape display fields in one pass (explanation may be empty)
+                escaped_title, escaped_source, escaped_url, escaped_explanation = map(
+                    _esc,
+                    (
+                        article.get('title', 'Untitled'),
+                        article.get('source', 'Unknown Source'),
+                        article.get('url', '#'),
+                        article.get('explanation', ''),
+                    )
+                )
                 
                 # Format similarity score as percentage
                 similarity_score = article.get('similarity_score', 0.0)
@@ -665,13 +786,13 @@ def render_analysis_tabs(article_data=None):
                                             AI-Generated Summary:
                                         </p>
                                         <p style="margin: 0; font-size: 0.85rem; color: #4b5563;">
-                                            {html.escape(summary_text)}
+                                            {_esc(summary_text)}
                                         </p>
                                     </div>
                                     """
                             except Exception as e:
                                 # Silently handle errors for related articles summaries
-                                logger.error(f"Error generating summary for related article: {str(e)}")
+                                logger.error("Error generating summary for related article: %s", e)
                                 pass
                 
                 st.markdown(
@@ -755,68 +876,39 @@ def render_analysis_tabs(article_data=None):
                 
                 if claims:
                     # Display statistics
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        st.markdown(
-                            f"""
-                            <div style="background: linear-gradient(120deg, #e3f0fc 0%, #f8fafc 100%); border-radius: 12px; padding: 1rem; text-align: center; box-shadow: 0 2px 8px rgba(180,180,200,0.1);">
-                                <h4 style="color: #234e52; margin: 0; font-size: 1.5rem;">{stats['total_claims']}</h4>
-                                <p style="color: #1e293b; margin: 0; font-size: 0.9rem;">Total Claims</p>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
-                    
-                    with col2:
-                        st.markdown(
-                            f"""
-                            <div style="background: linear-gradient(120deg, #fceabb 0%, #f8fafc 100%); border-radius: 12px; padding: 1rem; text-align: center; box-shadow: 0 2px 8px rgba(180,180,200,0.1);">
-                                <h4 style="color: #234e52; margin: 0; font-size: 1.5rem;">{stats['avg_confidence']}</h4>
-                                <p style="color: #1e293b; margin: 0; font-size: 0.9rem;">Avg Confidence</p>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
-                    
-                    with col3:
-                        st.markdown(
-                            f"""
-                            <div style="background: linear-gradient(120deg, #f8fafc 0%, #e3f0fc 100%); border-radius: 12px; padding: 1rem; text-align: center; box-shadow: 0 2px 8px rgba(180,180,200,0.1);">
-                                <h4 style="color: #234e52; margin: 0; font-size: 1.5rem;">{stats['high_confidence_count']}</h4>
-                                <p style="color: #1e293b; margin: 0; font-size: 0.9rem;">High Confidence</p>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
+                    _render_stat_row(
+                        [
+                            ("#e3f0fc 0%, #f8fafc 100%", "#234e52", stats['total_claims'], "#1e293b", "Total Claims"),
+                            ("#fceabb 0%, #f8fafc 100%", "#234e52", stats['avg_confidence'], "#1e293b", "Avg Confidence"),
+                            ("#f8fafc 0%, #e3f0fc 100%", "#234e52", stats['high_confidence_count'], "#1e293b", "High Confidence"),
+                        ],
+                        value_size="1.5rem",
+                        label_size="0.9rem"
+                    )
                     
                     st.markdown("<br>", unsafe_allow_html=True)
                     
-                    # Display individual claims
+                    # Display individual claims as one block
+                    cards = []
                     for i, claim_data in enumerate(claims, 1):
                         claim_text = claim_data["claim"]
                         confidence = claim_data["confidence"]
                         
-                        # Color scheme based on confidence
-                        if confidence >= 0.8:
-                            color_scheme = {"bg": "#38b2ac", "shadow": "rgba(56, 178, 172, 0.2)", "confidence_color": "#059669"}
-                        elif confidence >= 0.6:
-                            color_scheme = {"bg": "#4169e1", "shadow": "rgba(65, 105, 225, 0.2)", "confidence_color": "#2563eb"}
-                        else:
-                            color_scheme = {"bg": "#f59e0b", "shadow": "rgba(245, 158, 11, 0.2)", "confidence_color": "#d97706"}
+                        # Color scheme based on confidence (high / medium / low)
+                        bg, shadow, confidence_color = _CONFIDENCE_SCHEMES[
+                            0 if confidence >= 0.8 else 1 if confidence >= 0.6 else 2
+                        ]
                         
                         # Escape HTML content for claims
-                        import html
-                        escaped_claim = html.escape(claim_text)
+                        escaped_claim = _esc(claim_text)
                         
-                        st.markdown(
-                            f"""
-                            <div style="background: linear-gradient(120deg, rgba(255, 255, 255, 0.92) 0%, rgba(227,240,252,0.88) 100%); backdrop-filter: blur(15px); border: 1px solid rgba(227,240,252,0.5); border-radius: 16px; padding: 1.4rem; margin-bottom: 1rem; box-shadow: 0 6px 20px {color_scheme['shadow']}; position: relative; border-left: 4px solid {color_scheme['bg']};">
+                        cards.append(
+                            f"""<div style="background: linear-gradient(120deg, rgba(255, 255, 255, 0.92) 0%, rgba(227,240,252,0.88) 100%); backdrop-filter: blur(15px); border: 1px solid rgba(227,240,252,0.5); border-radius: 16px; padding: 1.4rem; margin-bottom: 1rem; box-shadow: 0 6px 20px {shadow}; position: relative; border-left: 4px solid {bg};">
                                 <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 0.8rem;">
-                                    <div style="background: {color_scheme['bg']}; color: white; border-radius: 20px; padding: 0.3rem 0.8rem; font-size: 0.8rem; font-weight: bold;">
+                                    <div style="background: {bg}; color: white; border-radius: 20px; padding: 0.3rem 0.8rem; font-size: 0.8rem; font-weight: bold;">
                                         Claim #{i}
                                     </div>
-                                    <div style="background: {color_scheme['confidence_color']}; color: white; border-radius: 20px; padding: 0.3rem 0.8rem; font-size: 0.8rem; font-weight: bold;">
+                                    <div style="background: {confidence_color}; color: white; border-radius: 20px; padding: 0.3rem 0.8rem; font-size: 0.8rem; font-weight: bold;">
                                         {int(confidence * 100)}% confidence
                                     </div>
                                 </div>
@@ -825,10 +917,10 @@ def render_analysis_tabs(article_data=None):
                                         {escaped_claim}
                                     </p>
                                 </div>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
+                            </div>"""
                         )
+                    
+                    _render_claim_cards(cards)
                 
                 else:
                     st.markdown(
@@ -890,8 +982,7 @@ def render_analysis_tabs(article_data=None):
                 'Inaccurate': '#ef4444'
             }.get(overall_assessment, '#6b7280')
             
-            import html
-            escaped_assessment = html.escape(overall_assessment)
+            escaped_assessment = _esc(overall_assessment)
             st.markdown(
                 f"""
                 <div style="background: rgba(255,255,255,0.95); border-radius: 15px; padding: 1.5rem; margin-bottom: 1.5rem; box-shadow: 0 4px 20px rgba(0,0,0,0.06); border: 1px solid rgba(0,0,0,0.05); text-align: center;">
@@ -916,41 +1007,28 @@ def render_analysis_tabs(article_data=None):
                     unsafe_allow_html=True
                 )
                 
+                cards = []
                 for i, claim in enumerate(claims, 1):
                     assessment = claim.get('assessment', 'Unknown')
                     claim_text = claim.get('claim', '')
                     evidence = claim.get('evidence', '')
                     
                     # Color scheme based on assessment
-                    color_schemes = {
-                        'Accurate': {
-                            'bg': '#10b981', 'emoji': '✅', 'shadow': 'rgba(16, 185, 129, 0.2)',
-                            'verdict_bg': '#d1fae5', 'verdict_color': '#065f46'
-                        },
-                        'Partially Accurate': {
-                            'bg': '#f59e0b', 'emoji': '⚠️', 'shadow': 'rgba(245, 158, 11, 0.2)',
-                            'verdict_bg': '#fef3c7', 'verdict_color': '#92400e'
-                        },
-                        'False': {
-                            'bg': '#ef4444', 'emoji': '❌', 'shadow': 'rgba(239, 68, 68, 0.2)',
-                            'verdict_bg': '#fee2e2', 'verdict_color': '#991b1b'
-                        }
-                    }
-                    color_scheme = color_schemes.get(assessment, color_schemes['Partially Accurate'])
+                    bg, emoji, shadow, verdict_bg, verdict_color = _ASSESSMENT_SCHEMES.get(
+                        assessment, _ASSESSMENT_SCHEMES['Partially Accurate']
+                    )
                     
-                    escaped_claim = html.escape(claim_text)
-                    escaped_evidence = html.escape(evidence)
+                    escaped_claim, escaped_evidence = map(_esc, (claim_text, evidence))
                     
-                    st.markdown(
-                        f"""
-                        <div style="background: linear-gradient(120deg, rgba(255, 255, 255, 0.92) 0%, rgba(255,240,245,0.88) 100%); backdrop-filter: blur(15px); border: 1px solid rgba(255,240,245,0.5); border-radius: 16px; padding: 1.4rem; margin-bottom: 1rem; box-shadow: 0 6px 20px {color_scheme['shadow']}; position: relative; border-left: 4px solid {color_scheme['bg']};">
+                    cards.append(
+                        f"""<div style="background: linear-gradient(120deg, rgba(255, 255, 255, 0.92) 0%, rgba(255,240,245,0.88) 100%); backdrop-filter: blur(15px); border: 1px solid rgba(255,240,245,0.5); border-radius: 16px; padding: 1.4rem; margin-bottom: 1rem; box-shadow: 0 6px 20px {shadow}; position: relative; border-left: 4px solid {bg};">
                             <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 1rem;">
-                                <div style="background: {color_scheme['bg']}; color: white; border-radius: 20px; padding: 0.3rem 0.8rem; font-size: 0.8rem; font-weight: bold;">
+                                <div style="background: {bg}; color: white; border-radius: 20px; padding: 0.3rem 0.8rem; font-size: 0.8rem; font-weight: bold;">
                                     Claim #{i}
                                 </div>
                                 <div style="display: flex; align-items: center; gap: 0.5rem;">
-                                    <span style="font-size: 0.9rem;">{color_scheme['emoji']}</span>
-                                    <div style="background: {color_scheme['verdict_bg']}; color: {color_scheme['verdict_color']}; border-radius: 20px; padding: 0.3rem 0.8rem; font-size: 0.8rem; font-weight: bold;">
+                                    <span style="font-size: 0.9rem;">{emoji}</span>
+                                    <div style="background: {verdict_bg}; color: {verdict_color}; border-radius: 20px; padding: 0.3rem 0.8rem; font-size: 0.8rem; font-weight: bold;">
                                         {assessment}
                                     </div>
                                 </div>
@@ -965,10 +1043,10 @@ def render_analysis_tabs(article_data=None):
                                     <strong>Evidence:</strong> {escaped_evidence}
                                 </p>
                             </div>
-                        </div>
-                        """,
-                        unsafe_allow_html=True
+                        </div>"""
                     )
+                
+                _render_claim_cards(cards)
             
         # For non-sample articles, check if we have extracted claims to fact-check (existing logic)
         elif hasattr(st.session_state, 'extracted_claims') and st.session_state.extracted_claims:
@@ -979,120 +1057,37 @@ def render_analysis_tabs(article_data=None):
                 
                 if fact_checked_claims:
                     # Display fact-check statistics
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    with col1:
-                        st.markdown(
-                            f"""
-                            <div style="background: linear-gradient(120deg, #e3f0fc 0%, #f8fafc 100%); border-radius: 12px; padding: 1rem; text-align: center; box-shadow: 0 2px 8px rgba(180,180,200,0.1);">
-                                <h4 style="color: #234e52; margin: 0; font-size: 1.3rem;">{fact_check_stats['total_claims']}</h4>
-                                <p style="color: #1e293b; margin: 0; font-size: 0.85rem;">Total Checked</p>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
-                    
-                    with col2:
-                        st.markdown(
-                            f"""
-                            <div style="background: linear-gradient(120deg, #dcfce7 0%, #f0fdf4 100%); border-radius: 12px; padding: 1rem; text-align: center; box-shadow: 0 2px 8px rgba(180,180,200,0.1);">
-                                <h4 style="color: #059669; margin: 0; font-size: 1.3rem;">{fact_check_stats['accurate_count']}</h4>
-                                <p style="color: #065f46; margin: 0; font-size: 0.85rem;">Accurate</p>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
-                    
-                    with col3:
-                        st.markdown(
-                            f"""
-                            <div style="background: linear-gradient(120deg, #fef3c7 0%, #fffbeb 100%); border-radius: 12px; padding: 1rem; text-align: center; box-shadow: 0 2px 8px rgba(180,180,200,0.1);">
-                                <h4 style="color: #d97706; margin: 0; font-size: 1.3rem;">{fact_check_stats['partially_accurate_count']}</h4>
-                                <p style="color: #92400e; margin: 0; font-size: 0.85rem;">Partially Accurate</p>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
-                    
-                    with col4:
-                        st.markdown(
-                            f"""
-                            <div style="background: linear-gradient(120deg, #fee2e2 0%, #fef2f2 100%); border-radius: 12px; padding: 1rem; text-align: center; box-shadow: 0 2px 8px rgba(180,180,200,0.1);">
-                                <h4 style="color: #dc2626; margin: 0; font-size: 1.3rem;">{fact_check_stats['false_count']}</h4>
-                                <p style="color: #991b1b; margin: 0; font-size: 0.85rem;">False</p>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
+                    _render_stat_row(
+                        [
+                            ("#e3f0fc 0%, #f8fafc 100%", "#234e52", fact_check_stats['total_claims'], "#1e293b", "Total Checked"),
+                            ("#dcfce7 0%, #f0fdf4 100%", "#059669", fact_check_stats['accurate_count'], "#065f46", "Accurate"),
+                            ("#fef3c7 0%, #fffbeb 100%", "#d97706", fact_check_stats['partially_accurate_count'], "#92400e", "Partially Accurate"),
+                            ("#fee2e2 0%, #fef2f2 100%", "#dc2626", fact_check_stats['false_count'], "#991b1b", "False"),
+                        ],
+                        value_size="1.3rem",
+                        label_size="0.85rem"
+                    )
                     
                     st.markdown("<br>", unsafe_allow_html=True)
                     
-                    # Display individual fact-checked claims
+                    # Display individual fact-checked claims as one block
+                    parts = []
                     for i, claim_data in enumerate(fact_checked_claims, 1):
-                        claim_text = claim_data["claim"]
                         verdict = claim_data["verdict"]
-                        justification = claim_data["justification"]
-                        confidence = claim_data["confidence"]
-                        
-                        # Color scheme based on verdict
-                        if verdict == "Accurate":
-                            color_scheme = {
-                                "bg": "#059669", 
-                                "shadow": "rgba(5, 150, 105, 0.2)", 
-                                "verdict_bg": "#dcfce7",
-                                "verdict_color": "#059669",
-                                "emoji": "🟢"
-                            }
-                        elif verdict == "Partially Accurate":
-                            color_scheme = {
-                                "bg": "#d97706", 
-                                "shadow": "rgba(217, 119, 6, 0.2)", 
-                                "verdict_bg": "#fef3c7",
-                                "verdict_color": "#d97706",
-                                "emoji": "🟡"
-                            }
-                        else:  # False
-                            color_scheme = {
-                                "bg": "#dc2626", 
-                                "shadow": "rgba(220, 38, 38, 0.2)", 
-                                "verdict_bg": "#fee2e2",
-                                "verdict_color": "#dc2626",
-                                "emoji": "🔴"
-                            }
+                        template = _VERDICT_TEMPLATES.get(verdict, _TEMPLATE_FALSE)
                         
                         # Escape HTML content for claims and justification
-                        import html
-                        escaped_claim = html.escape(claim_text)
-                        escaped_justification = html.escape(justification)
+                        escaped_claim = _esc(claim_data["claim"])
+                        escaped_justification = _esc(claim_data["justification"])
                         
-                        st.markdown(
-                            f"""
-                            <div style="background: linear-gradient(120deg, rgba(255, 255, 255, 0.92) 0%, rgba(255,240,245,0.88) 100%); backdrop-filter: blur(15px); border: 1px solid rgba(255,240,245,0.5); border-radius: 16px; padding: 1.4rem; margin-bottom: 1rem; box-shadow: 0 6px 20px {color_scheme['shadow']}; position: relative; border-left: 4px solid {color_scheme['bg']};">
-                                <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 1rem;">
-                                    <div style="background: {color_scheme['bg']}; color: white; border-radius: 20px; padding: 0.3rem 0.8rem; font-size: 0.8rem; font-weight: bold;">
-                                        Claim #{i}
-                                    </div>
-                                    <div style="display: flex; align-items: center; gap: 0.5rem;">
-                                        <span style="font-size: 0.9rem;">{color_scheme['emoji']}</span>
-                                        <div style="background: {color_scheme['verdict_bg']}; color: {color_scheme['verdict_color']}; border-radius: 20px; padding: 0.3rem 0.8rem; font-size: 0.8rem; font-weight: bold;">
-                                            {verdict}
-                                        </div>
-                                    </div>
-                                </div>
-                                <div style="padding: 0.5rem 0; margin-bottom: 1rem;">
-                                    <p style="color: #1a202c; font-size: 1rem; line-height: 1.6; margin: 0; text-align: justify; font-family: 'Inter', 'Segoe UI', sans-serif; font-weight: 500;">
-                                        {escaped_claim}
-                                    </p>
-                                </div>
-                                <div style="background: rgba(255, 255, 255, 0.6); border-radius: 8px; padding: 1rem; border: 1px solid rgba(0, 0, 0, 0.05);">
-                                    <p style="color: #6b7280; font-size: 0.9rem; line-height: 1.5; margin: 0; font-style: italic; font-family: 'Inter', 'Segoe UI', sans-serif;">
-                                        <strong>Justification:</strong> {escaped_justification}
-                                    </p>
-                                </div>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
+                        parts.append(template.format(
+                            i=i,
+                            verdict=verdict,
+                            claim=escaped_claim,
+                            justification=escaped_justification
+                        ))
+                    
+                    _render_claim_cards(parts)
                 else:
                     st.markdown(
                         """
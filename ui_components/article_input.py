@@ -7,7 +7,6 @@ to provide a clean and organized article input experience.
 """
 
 import streamlit as st
-from tools.fetcher import fetch_article_with_newspaper
 from ui_components.navigation import (
     show_workflow_breadcrumbs, 
     show_back_to_search_button, 
@@ -24,7 +23,8 @@ from ui_components.ui_helpers import (
     create_dataset_uploader,
     show_article_preview_card,
     show_analysis_start_button,
-    SAMPLE_ARTICLES
+    get_sample_articles,
+    SOURCE_EMOJI
 )
 from ui_components.search_components import (
     create_search_interface,
@@ -39,6 +39,47 @@ from ui_components.dataset_components import (
 )
 
 
+class _FetchFailed(Exception):
+    """Carries an unsuccessful fetch result out of the cached fetcher so it is not cached"""
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_fetch(url):
+    """Fetch an article once per URL; successful results are reused for an hour"""
+    # Imported lazily: newspaper3k pulls in lxml/nltk and is only needed on fetch
+    from tools.fetcher import fetch_article_with_newspaper
+    result = fetch_article_with_newspaper(url)
+    if not result or not result.get('success', False):
+        raise _FetchFailed(result)
+    return result
+
+
+def fetch_article_cached(url):
+    """Fetch an article through the URL cache, returning failures uncached"""
+    try:
+        return _cached_fetch(url)
+    except _FetchFailed as e:
+        return e.args[0]
+
+
+def _start_analysis():
+    """
+    on_click callback for the Start Analysis button. Runs before the rerun the
+    click triggers, so render_article_input opens straight in analysis mode
+    without a second st.rerun().
+    """
+    # Every fetch path stores its result as temp_article_data
+    analysis_article = st.session_state.get('temp_article_data')
+    if not analysis_article:
+        return
+    
+    # Store article data and switch to analysis mode
+    st.session_state.article_data = analysis_article
+    st.session_state.analysis_mode = True
+    # Clear temporary data
+    st.session_state.pop('temp_article_data', None)
+
+
 def show_analysis_header(article_data):
     """
     Show a header with article info and back to search navigation when in analysis mode
@@ -58,14 +99,12 @@ def show_analysis_header(article_data):
             clear_analysis_mode()
     
     # Article info card with enhanced styling
-    source_emoji = {
-        "sample": "🧪",
-        "url": "🌐", 
-        "search_result": "🔍",
-        "uploaded_dataset": "📂"
-    }.get(article_data.get("source", ""), "📄")
+    source_emoji = SOURCE_EMOJI.get(article_data.get("source", ""), "📄")
     
     original_source = article_data.get("original_source", article_data.get("source", "Unknown"))
+    char_count = len(article_data.get('content') or '')
+    domain = article_data.get('domain')
+    url_clause = f" | <strong>URL:</strong> {domain}" if domain else ""
     
     st.markdown(
         f"""
@@ -83,8 +122,8 @@ def show_analysis_header(article_data):
             </h3>
             <p style="color: #6b7280; font-size: 0.9rem; margin: 0;">
                 <strong>Source:</strong> {original_source} | 
-                <strong>Content:</strong> {len(article_data.get('content', '')):,} characters
-                {f" | <strong>URL:</strong> {article_data.get('domain', 'N/A')}" if article_data.get('domain') else ""}
+                <strong>Content:</strong> {char_count:,} characters
+                {url_clause}
             </p>
         </div>
         """,
@@ -94,24 +133,27 @@ def show_analysis_header(article_data):
 
 def handle_url_input(url_input):
     """Handle URL input and fetch article content"""
+    # Normalize once so the fetch cache keys on the trimmed URL
+    url = (url_input or "").strip()
+    
     # Check if URL is blank or empty
-    if not url_input or not url_input.strip():
+    if not url:
         st.warning("⚠️ Please enter an article URL before clicking Fetch Article")
         return None
     
     # Check if URL format is valid
-    if not url_input.startswith(('http://', 'https://')):
+    if not url.startswith(('http://', 'https://')):
         st.error("❌ Please enter a valid URL starting with http:// or https://")
         return None
     
     with st.spinner("🌐 Fetching article content..."):
         try:
-            result = fetch_article_with_newspaper(url_input)
+            result = fetch_article_cached(url)
             if result and result.get('success', False):
                 article_data = {
                     'title': result['title'],
                     'content': result['content'], 
-                    'url': url_input,
+                    'url': url,
                     'source': 'url',
                     'domain': result.get('domain', 'Unknown'),
                     'author': result.get('author', 'Unknown Author'),
@@ -155,7 +197,7 @@ def handle_sample_selection(selected_sample):
         return None
     
     # Get the selected sample and create full article data
-    sample = SAMPLE_ARTICLES[selected_sample]
+    sample = get_sample_articles()[selected_sample]
     
     # Show success message and create article data with full details
     st.success("✅ Sample article fetched successfully!")
@@ -187,7 +229,7 @@ def handle_search_workflow():
             # Don't rerun here - let the results show immediately
     
     # Display existing search results
-    if hasattr(st.session_state, 'search_results') and st.session_state.search_results:
+    if st.session_state.get('search_results'):
         selected_result, fetch_selected = display_search_results(st.session_state.search_results)
         
         if fetch_selected and selected_result:
@@ -201,7 +243,7 @@ def handle_search_workflow():
                         st.error("❌ Error: No URL found in search result")
                         return None
                     
-                    result = fetch_article_with_newspaper(article_url)
+                    result = fetch_article_cached(article_url)
                     if result and result.get('success', False):
                         article_data = {
                             'title': result['title'] or selected_result['title'],
@@ -283,10 +325,7 @@ def render_article_input():
     """Main render function - now much cleaner and organized!"""
     
     # Check if we're in analysis mode - must have both article_data AND analysis_mode=True
-    if (hasattr(st.session_state, 'article_data') and 
-        st.session_state.article_data and 
-        hasattr(st.session_state, 'analysis_mode') and
-        st.session_state.analysis_mode is True):
+    if st.session_state.get('article_data') and st.session_state.get('analysis_mode') is True:
         show_analysis_header(st.session_state.article_data)
         return st.session_state.article_data
     
@@ -337,7 +376,7 @@ def render_article_input():
             # Don't call st.rerun() - let it continue in same execution
     
     # Check for temporarily stored article data
-    if hasattr(st.session_state, 'temp_article_data') and st.session_state.temp_article_data:
+    if st.session_state.get('temp_article_data'):
         article_data = st.session_state.temp_article_data
     
     # Always show the three main action buttons
@@ -361,27 +400,16 @@ def render_article_input():
             type="primary",
             use_container_width=True,
             help="Begin comprehensive fact-checking analysis of the article",
-            key="start_analysis_button"  # Add key to avoid button state conflicts
+            key="start_analysis_button",  # Add key to avoid button state conflicts
+            on_click=_start_analysis
         ):
-            # Check if we have article data to analyze
-            if not article_data and not (hasattr(st.session_state, 'temp_article_data') and st.session_state.temp_article_data):
-                st.error("⚠️ Please fetch an article first before starting fact-check analysis!")
-                st.info("💡 Complete Step 1 by fetching article content from any of the tabs above")
-            else:
-                # Use article data (either current or temporary)
-                analysis_article = article_data or st.session_state.temp_article_data
-                
-                # Store article data and switch to analysis mode
-                st.session_state.article_data = analysis_article
-                st.session_state.analysis_mode = True
-                # Clear temporary data
-                if hasattr(st.session_state, 'temp_article_data'):
-                    del st.session_state.temp_article_data
-                st.rerun()
+            # The callback already switched to analysis mode if there was an article;
+            # reaching here with the button pressed means there was nothing to analyze
+            st.error("⚠️ Please fetch an article first before starting fact-check analysis!")
+            st.info("💡 Complete Step 1 by fetching article content from any of the tabs above")
     
     with col3:
         st.markdown("**Step 3: Start Over** 🔄")
-        from ui_components.navigation import clear_analysis_mode
         if st.button(
             "🔄 Start New Search",
             type="secondary",
@@ -394,9 +422,6 @@ def render_article_input():
     
     # If we have article data, show preview (but analysis button is already shown above)
     if article_data:
-        # Show navigation breadcrumbs for article preview stage
-        from .navigation import show_workflow_breadcrumbs, show_back_to_search_button
-        
         # Inject navigation CSS for styling
         inject_navigation_css()
         
@@ -6,136 +6,161 @@ This module handles dataset upload, validation, and processing functionality.
 """
 
 import streamlit as st
+import html
 import json
+from string import Template
 from tools.dataset_processor import validate_json_dataset, process_jsonl_dataset, get_dataset_preview
 
+# orjson is optional; fall back to the standard json module when missing
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# Dataset preview HTML, compiled once; each block is kept free of blank lines
+# so the concatenated markup renders as a single HTML chunk
+_PREVIEW_HEADER_TPL = Template("""<div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.05) 0%, rgba(16, 185, 129, 0.02) 100%);
+           border-radius: 10px;
+           padding: 1.5rem;
+           margin: 1.5rem 0;
+           border: 1px solid rgba(16, 185, 129, 0.1);
+           box-shadow: 0 2px 8px rgba(16, 185, 129, 0.08);">
+    <h3 style="color: #065f46; font-size: 1.3rem; font-weight: 700; margin-bottom: 1rem;">
+        📂 Dataset Preview - $count Articles
+    </h3>
+</div>""")
+
+_PREVIEW_CARD_TPL = Template("""<div style="background: white; padding: 1rem; margin: 0.5rem 0; border-radius: 8px; border-left: 3px solid #10b981;">
+    <h4 style="margin: 0 0 0.5rem 0; color: #1f2937;">$title</h4>
+    <p style="margin: 0; color: #6b7280; font-size: 0.9rem;">$preview$ellipsis</p>
+</div>""")
+
+_PREVIEW_MORE_TPL = Template("""<div style="text-align: center; color: #6b7280; font-style: italic; margin: 1rem 0;">
+    ... and $remaining more articles
+</div>""")
+
+# Fields every uploaded article must carry
+_REQUIRED_FIELDS = frozenset(('title', 'content'))
+
+# Both parsers accept bytes, so uploads never need a separate decode step
+_json_loads = orjson.loads if HAVE_ORJSON else json.loads
+
+
+# Sample dataset offered for download; serialized once at import since it never changes
+_SAMPLE_DATA = [
+    {
+        "title": "Sample Article 1: Climate Change Research",
+        "content": "This is sample content about climate change research findings...",
+        "source": "Environmental Journal",
+        "date": "2024-01-15"
+    },
+    {
+        "title": "Sample Article 2: AI Technology Advances",
+        "content": "This is sample content about recent advances in artificial intelligence...",
+        "source": "Tech News",
+        "date": "2024-01-20"
+    }
+]
+
+if HAVE_ORJSON:
+    _SAMPLE_JSON = orjson.dumps(_SAMPLE_DATA, option=orjson.OPT_INDENT_2)
+else:
+    _SAMPLE_JSON = json.dumps(_SAMPLE_DATA, indent=2).encode('utf-8')
+
 
 def create_sample_dataset():
     """Create a sample dataset for download"""
-    sample_data = [
-        {
-            "title": "Sample Article 1: Climate Change Research",
-            "content": "This is sample content about climate change research findings...",
-            "source": "Environmental Journal",
-            "date": "2024-01-15"
-        },
-        {
-            "title": "Sample Article 2: AI Technology Advances",
-            "content": "This is sample content about recent advances in artificial intelligence...",
-            "source": "Tech News",
-            "date": "2024-01-20"
-        }
-    ]
-    return json.dumps(sample_data, indent=2)
+    return _SAMPLE_JSON
 
 
-def validate_dataset_format(uploaded_file):
-    """Validate the uploaded dataset format"""
+def load_and_validate(uploaded_file):
+    """
+    Parse the uploaded dataset and validate its format in a single pass.
+
+    Returns:
+        tuple: (articles, errors) - articles is None when the file cannot be used,
+        errors lists human-readable problems (empty when the dataset is valid)
+    """
     try:
         file_extension = uploaded_file.name.lower().split('.')[-1]
-        
+        uploaded_file.seek(0)
+
         if file_extension == 'json':
-            # Validate JSON format
-            content = uploaded_file.read().decode('utf-8')
-            uploaded_file.seek(0)  # Reset file pointer
-            
             try:
-                data = json.loads(content)
-                if not isinstance(data, list):
-                    st.error("❌ Invalid dataset format: JSON should contain a list of articles")
-                    return False
-                
-                # Check if each item has required fields
-                required_fields = ['title', 'content']
-                for i, item in enumerate(data[:5]):  # Check first 5 items
-                    if not isinstance(item, dict):
-                        st.error(f"❌ Invalid dataset format: Item {i+1} should be a dictionary")
-                        return False
-                    
-                    missing_fields = [field for field in required_fields if field not in item]
-                    if missing_fields:
-                        message = f"Item {i+1} missing fields: {', '.join(missing_fields)}"
-                        st.error(f"❌ Invalid dataset format: {message}")
-                        return False
-                
-                st.success("✅ Valid JSON dataset format")
-                return True
-                
+                # Zero-copy view of the upload; orjson parses it directly, json needs bytes
+                with uploaded_file.getbuffer() as buf:
+                    articles = _json_loads(buf if HAVE_ORJSON else bytes(buf))
             except json.JSONDecodeError as e:
-                st.error(f"❌ Invalid JSON format: {str(e)}")
-                return False
-                
+                return None, [f"Invalid JSON format: {str(e)}"]
+            if not isinstance(articles, list):
+                return None, ["Invalid dataset format: JSON should contain a list of articles"]
+
+            # Check if each item has required fields
+            for i, item in enumerate(articles[:5]):  # Check first 5 items
+                if not isinstance(item, dict):
+                    return None, [f"Invalid dataset format: Item {i+1} should be a dictionary"]
+
+                missing_fields = _REQUIRED_FIELDS - item.keys()
+                if missing_fields:
+                    return None, [f"Invalid dataset format: Item {i+1} missing fields: {', '.join(sorted(missing_fields))}"]
+            return articles, []
+
         elif file_extension == 'jsonl':
-            # Validate JSONL format
-            content = uploaded_file.read().decode('utf-8')
-            uploaded_file.seek(0)  # Reset file pointer
-            
-            lines = content.strip().split('\n')
-            for i, line in enumerate(lines[:5]):  # Check first 5 lines
+            articles = []
+            # Parse line by line straight from the upload buffer
+            lines = (line for line in uploaded_file if line.strip())
+            for i, line in enumerate(lines):
                 try:
-                    item = json.loads(line)
-                    if not isinstance(item, dict):
-                        st.error(f"❌ Invalid JSONL format: Line {i+1} should be a JSON object")
-                        return False
+                    item = _json_loads(line)
                 except json.JSONDecodeError as e:
-                    st.error(f"❌ Invalid JSON on line {i+1}: {str(e)}")
-                    return False
-            
-            st.success("✅ Valid JSONL dataset format")
-            return True
-        else:
-            st.error("❌ Unsupported file format")
-            return False
-            
+                    return None, [f"Invalid JSON on line {i+1}: {str(e)}"]
+                if i < 5 and not isinstance(item, dict):  # Check first 5 lines
+                    return None, [f"Invalid JSONL format: Line {i+1} should be a JSON object"]
+                articles.append(item)
+            return articles, []
+
+        return None, ["Unsupported file format"]
+
     except Exception as e:
-        st.error(f"❌ Error validating dataset: {str(e)}")
+        return None, [f"Error validating dataset: {str(e)}"]
+    finally:
+        uploaded_file.seek(0)  # Reset file pointer
+
+
+def validate_dataset_format(uploaded_file):
+    """Validate the uploaded dataset format"""
+    articles, errors = load_and_validate(uploaded_file)
+    for error in errors:
+        st.error(f"❌ {error}")
+    if articles is None:
         return False
+    
+    file_extension = uploaded_file.name.lower().split('.')[-1]
+    st.success(f"✅ Valid {file_extension.upper()} dataset format")
+    return True
+
+
+def _preview_card(index: int, article: dict) -> str:
+    """Escaped preview card for one article, reading and truncating its content once"""
+    content = article.get('content') or ''
+    return _PREVIEW_CARD_TPL.substitute(
+        title=html.escape(str(article.get('title', f'Article {index+1}'))),
+        preview=html.escape(content[:100]),
+        ellipsis='...' if len(content) > 100 else ''
+    )
 
 
 def show_dataset_preview(articles):
     """Show preview of dataset articles"""
+    # Show first few articles; header, cards and footer go out in one markdown call
+    cards = "".join(_preview_card(i, article) for i, article in enumerate(articles[:3]))
+    more = _PREVIEW_MORE_TPL.substitute(remaining=len(articles) - 3) if len(articles) > 3 else ""
+    
     st.markdown(
-        f"""
-        <div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.05) 0%, rgba(16, 185, 129, 0.02) 100%);
-                   border-radius: 10px;
-                   padding: 1.5rem;
-                   margin: 1.5rem 0;
-                   border: 1px solid rgba(16, 185, 129, 0.1);
-                   box-shadow: 0 2px 8px rgba(16, 185, 129, 0.08);">
-            <h3 style="color: #065f46; font-size: 1.3rem; font-weight: 700; margin-bottom: 1rem;">
-                📂 Dataset Preview - {len(articles)} Articles
-            </h3>
-        </div>
-        """,
+        _PREVIEW_HEADER_TPL.substitute(count=len(articles)) + cards + more,
         unsafe_allow_html=True
     )
-    
-    # Show first few articles
-    for i, article in enumerate(articles[:3]):
-        title = article.get('title', f'Article {i+1}')
-        content_preview = article.get('content', '')[:100]
-        
-        st.markdown(
-            f"""
-            <div style="background: white; padding: 1rem; margin: 0.5rem 0; border-radius: 8px; border-left: 3px solid #10b981;">
-                <h4 style="margin: 0 0 0.5rem 0; color: #1f2937;">{title}</h4>
-                <p style="margin: 0; color: #6b7280; font-size: 0.9rem;">{content_preview}{'...' if len(article.get('content', '')) > 100 else ''}</p>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-    
-    if len(articles) > 3:
-        st.markdown(
-            f"""
-            <div style="text-align: center; color: #6b7280; font-style: italic; margin: 1rem 0;">
-                ... and {len(articles) - 3} more articles
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-    else:
-        st.markdown("</div>", unsafe_allow_html=True)
 
 
 def process_dataset_batch(articles: list, filename: str):
@@ -189,35 +214,40 @@ def process_dataset_batch(articles: list, filename: str):
         return None
 
 
+def _selector_label(index: int, article: dict) -> str:
+    """Option label for an article in the dataset selector"""
+    title = article.get('title', f'Article {index+1}')
+    return f"{index+1}. {title[:80] + '...' if len(title) > 80 else title}"
+
+
 def create_article_selector(articles: list):
     """Create interface to select specific articles from dataset"""
     st.markdown("### 📝 Select Articles to Analyze")
     
-    selected_articles = []
-    
-    for i, article in enumerate(articles):
-        title = article.get('title', f'Article {i+1}')
-        content_preview = article.get('content', '')[:150]
-        
-        if st.checkbox(
-            f"**{title}**\n{content_preview}{'...' if len(article.get('content', '')) > 150 else ''}",
-            key=f"article_select_{i}"
-        ):
-            selected_articles.append(article)
-    
-    if selected_articles:
-        st.success(f"✅ Selected {len(selected_articles)} articles")
+    # One multiselect holds the whole selection as a single widget state entry,
+    # and the form sends it in one rerun on submit
+    with st.form("select_articles"):
+        picks = st.multiselect(
+            "Select articles",
+            range(len(articles)),
+            format_func=lambda i: _selector_label(i, articles[i]),
+            key="article_select"
+        )
         
         # Add prominent fetch button with unique name
         st.markdown("**Step 1: Fetch Dataset Articles**")
-        fetch_button = st.button(
-            f"📂 Fetch from Dataset ({len(selected_articles)})",
+        fetch_button = st.form_submit_button(
+            "📂 Fetch from Dataset",
             type="primary",
             use_container_width=True,
-            help="Click to fetch the selected articles for analysis",
-            key="fetch_dataset_button"  # Unique key for dataset handler
+            help="Click to fetch the selected articles for analysis"
         )
-        
+    
+    # Indices rather than titles, so articles sharing a title stay distinct
+    selected_articles = [articles[i] for i in sorted(picks)]
+    
+    if selected_articles:
+        st.success(f"✅ Selected {len(selected_articles)} articles")
         return selected_articles, fetch_button
     
     return [], False
@@ -226,21 +256,14 @@ def create_article_selector(articles: list):
 def handle_dataset_upload(uploaded_file):
     """Handle the uploaded dataset file"""
     try:
-        if not validate_dataset_format(uploaded_file):
+        articles, errors = load_and_validate(uploaded_file)
+        if articles is None:
+            for error in errors:
+                st.error(f"❌ {error}")
             return None, None
-            
-        file_extension = uploaded_file.name.lower().split('.')[-1]
         
-        if file_extension == 'json':
-            content = uploaded_file.read().decode('utf-8')
-            articles = json.loads(content)
-        elif file_extension == 'jsonl':
-            content = uploaded_file.read().decode('utf-8')
-            lines = content.strip().split('\n')
-            articles = [json.loads(line) for line in lines if line.strip()]
-        else:
-            st.error("❌ Unsupported file format")
-            return None, None
+        file_extension = uploaded_file.name.lower().split('.')[-1]
+        st.success(f"✅ Valid {file_extension.upper()} dataset format")
         
         show_dataset_preview(articles)
         return articles, uploaded_file.name
@@ -265,8 +288,8 @@ def create_dataset_uploader():
         st.success(f"📁 File uploaded: {uploaded_file.name}")
         
         # Show file info
-        file_size = len(uploaded_file.read())
-        uploaded_file.seek(0)  # Reset file pointer
+        # UploadedFile knows its size; reading it just to measure copies the payload
+        file_size = getattr(uploaded_file, "size", None) or uploaded_file.getbuffer().nbytes
         st.info(f"📋 File size: {file_size:,} bytes")
         
         col1, col2 = st.columns(2)
@@ -12,10 +12,22 @@ Components:
 - Navigation-related UI elements
 """
 
+import re
+
 import streamlit as st
 from typing import Dict, Any, Optional, List
 
 
+# Session-state keys (matched as substrings) that survive a full reset
+_KEEP_KEYS = (
+    'FormSubmitter:article_input-Submit',
+    'FormSubmitter:search_form-Search',
+    'widget_key',
+    'button_key'
+)
+_KEEP_KEYS_RE = re.compile("|".join(map(re.escape, _KEEP_KEYS)))
+
+
 def show_workflow_breadcrumbs(current_step: str = "search", article_title: Optional[str] = None) -> None:
     """
     Simple function that does nothing - breadcrumbs removed per user request.
@@ -32,6 +44,7 @@ def show_workflow_breadcrumbs(current_step: str = "search", article_title: Optio
 def show_back_to_search_button(button_key: str = "back_to_search") -> bool:
     """
     Display a prominent 'Start New Search' button that completely resets the application.
+    Button styling lives in NAVIGATION_CSS; call inject_navigation_css() first.
     
     Args:
         button_key: Unique key for the button component
@@ -57,38 +70,6 @@ def show_back_to_search_button(button_key: str = "back_to_search") -> bool:
         if back_clicked:
             st.info("🔄 Clearing all data and returning to search...")
     
-    # Add custom CSS for the reset button
-    st.markdown(
-        """
-        <style>
-        .stButton > button {
-            background: linear-gradient(135deg, #dc2626 0%, #991b1b 100%) !important;
-            color: white !important;
-            border: none !important;
-            border-radius: 8px !important;
-            padding: 0.75rem 2rem !important;
-            font-weight: 700 !important;
-            font-size: 1rem !important;
-            box-shadow: 0 3px 10px rgba(220, 38, 38, 0.3) !important;
-            transition: all 0.3s ease !important;
-            margin: 0.5rem 0 !important;
-        }
-        
-        .stButton > button:hover {
-            background: linear-gradient(135deg, #b91c1c 0%, #7f1d1d 100%) !important;
-            box-shadow: 0 5px 15px rgba(220, 38, 38, 0.4) !important;
-            transform: translateY(-1px) !important;
-        }
-        
-        .stButton > button:active {
-            transform: translateY(0px) !important;
-            box-shadow: 0 2px 8px rgba(220, 38, 38, 0.4) !important;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
-    
     return back_clicked
 
 
@@ -98,48 +79,12 @@ def clear_analysis_mode() -> None:
     Completely resets all session state to start fresh.
     """
     
-    # Clear ALL session state keys to start completely fresh
-    keys_to_clear = [
-        'analysis_mode',
-        'article_data',
-        'temp_article_data',
-        'selected_article_url',
-        'selected_article_title',
-        'analysis_results',
-        'current_analysis_step',
-        'search_results',
-        'last_search_query',
-        'selected_search_article',
-        'dataset_results',
-        'current_workflow_step',
-        # Additional keys that might persist
-        'use_langchain_toggle',
-        'navigation_css_injected',
-        'font_awesome_injected',
-        'back_button_css_added',
-        # Any other potential keys
-        'selected_result',
-        'analyze_selected'
-    ]
-    
-    # Alternative approach: Clear ALL session state except essential Streamlit keys
-    keys_to_keep = [
-        'FormSubmitter:article_input-Submit',
-        'FormSubmitter:search_form-Search',
-        'widget_key',
-        'button_key'
-    ]
-    
-    # Get all current session state keys
-    all_keys = list(st.session_state.keys())
-    
-    # Clear everything except essential Streamlit widget keys
-    for key in all_keys:
-        if not any(keep_key in key for keep_key in keys_to_keep):
-            try:
-                del st.session_state[key]
-            except KeyError:
-                pass  # Key already deleted or doesn't exist
+    # Clear ALL session state except essential Streamlit widget keys. Widget and
+    # form-submitter values cannot be re-assigned through session_state, so they
+    # are skipped rather than cleared and restored.
+    for key in list(st.session_state.keys()):
+        if not _KEEP_KEYS_RE.search(key):
+            st.session_state.pop(key, None)
     
     # Ensure we're not in analysis mode
     st.session_state.analysis_mode = False
@@ -147,10 +92,7 @@ def clear_analysis_mode() -> None:
     # Reset to search step
     st.session_state.current_workflow_step = 'search'
     
-    # Force a complete rerun to refresh the interface
-    st.rerun()
-    
-    # Rerun to refresh the interface
+    # Force a single complete rerun to refresh the interface
     st.rerun()
 
 
@@ -162,9 +104,9 @@ def check_returning_from_analysis() -> bool:
         bool: True if user is returning from analysis, False otherwise
     """
     
-    return (hasattr(st.session_state, 'analysis_mode') and 
+    return ('analysis_mode' in st.session_state and 
             not st.session_state.analysis_mode and 
-            hasattr(st.session_state, 'article_analysis_data'))
+            'article_analysis_data' in st.session_state)
 
 
 def show_returning_user_message() -> None:
@@ -184,13 +126,21 @@ def get_navigation_state() -> Dict[str, Any]:
         dict: Navigation state information
     """
     
+    # Read each key from session state once and derive everything from the snapshot
+    session = st.session_state
+    has_analysis_mode = 'analysis_mode' in session
+    analysis_mode = session.get('analysis_mode', False)
+    has_analysis_data = 'article_analysis_data' in session
+    search_results = session.get('search_results') or []
+    
     return {
-        'is_in_analysis_mode': getattr(st.session_state, 'analysis_mode', False),
-        'has_search_results': hasattr(st.session_state, 'search_results') and bool(st.session_state.search_results),
-        'has_analysis_data': hasattr(st.session_state, 'article_analysis_data'),
-        'is_returning_from_analysis': check_returning_from_analysis(),
-        'current_article_title': getattr(st.session_state, 'selected_article_title', None),
-        'search_results_count': len(getattr(st.session_state, 'search_results', []))
+        'is_in_analysis_mode': analysis_mode,
+        'has_search_results': bool(search_results),
+        'has_analysis_data': has_analysis_data,
+        # Same test as check_returning_from_analysis, inlined on the snapshot
+        'is_returning_from_analysis': has_analysis_mode and not analysis_mode and has_analysis_data,
+        'current_article_title': session.get('selected_article_title'),
+        'search_results_count': len(search_results)
     }
 
 
@@ -246,10 +196,8 @@ def handle_navigation_action(action: str, **kwargs) -> None:
             st.session_state.selected_article_title = kwargs['article_title']
         st.rerun()
     elif action == "clear_search":
-        search_keys = ['search_results', 'last_search_query', 'selected_search_article']
-        for key in search_keys:
-            if key in st.session_state:
-                del st.session_state[key]
+        for key in ('search_results', 'last_search_query', 'selected_search_article'):
+            st.session_state.pop(key, None)
         st.rerun()
     elif action == "show_help":
         show_navigation_help()
@@ -273,66 +221,47 @@ def is_analysis_mode() -> bool:
 
 def has_search_results() -> bool:
     """Check if search results are available."""
-    return hasattr(st.session_state, 'search_results') and bool(st.session_state.search_results)
+    return 'search_results' in st.session_state and bool(st.session_state.search_results)
 
 
-# CSS Styles for navigation components
+# Mode-specific CSS for navigation components. The shared .nav-* classes live in
+# assets/styles.css; only the reset-button override, which must not apply on
+# the search screen, is injected here.
 NAVIGATION_CSS = """
 <style>
-/* Navigation breadcrumbs styling */
-.nav-breadcrumb {
-    background: linear-gradient(135deg, rgba(255, 255, 255, 0.95) 0%, rgba(248, 250, 252, 0.95) 100%);
-    border-radius: 12px;
-    padding: 1rem;
-    margin: 1rem 0;
-    border: 1px solid rgba(203, 213, 225, 0.5);
-    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.05);
-}
-
-/* Back button enhanced styling */
-.nav-back-button {
-    background: linear-gradient(135deg, #3b82f6 0%, #1e40af 100%);
-    color: white;
-    border: none;
-    border-radius: 8px;
-    padding: 0.5rem 1.5rem;
-    font-weight: 600;
-    font-size: 0.95rem;
-    box-shadow: 0 2px 8px rgba(59, 130, 246, 0.3);
-    transition: all 0.3s ease;
-    cursor: pointer;
-}
-
-.nav-back-button:hover {
-    background: linear-gradient(135deg, #2563eb 0%, #1d4ed8 100%);
-    box-shadow: 0 4px 12px rgba(59, 130, 246, 0.4);
-    transform: translateY(-1px);
+/* Start New Search reset button */
+.stButton > button {
+    background: linear-gradient(135deg, #dc2626 0%, #991b1b 100%) !important;
+    color: white !important;
+    border: none !important;
+    border-radius: 8px !important;
+    padding: 0.75rem 2rem !important;
+    font-weight: 700 !important;
+    font-size: 1rem !important;
+    box-shadow: 0 3px 10px rgba(220, 38, 38, 0.3) !important;
+    transition: all 0.3s ease !important;
+    margin: 0.5rem 0 !important;
 }
 
-/* Navigation state indicators */
-.nav-active-step {
-    color: #1e40af;
-    background: rgba(59, 130, 246, 0.1);
-    font-weight: 700;
+.stButton > button:hover {
+    background: linear-gradient(135deg, #b91c1c 0%, #7f1d1d 100%) !important;
+    box-shadow: 0 5px 15px rgba(220, 38, 38, 0.4) !important;
+    transform: translateY(-1px) !important;
 }
 
-.nav-completed-step {
-    color: #059669;
-    background: rgba(16, 185, 129, 0.1);
-    font-weight: 600;
-}
-
-.nav-pending-step {
-    color: #6b7280;
-    background: rgba(107, 114, 128, 0.1);
-    font-weight: 500;
+.stButton > button:active {
+    transform: translateY(0px) !important;
+    box-shadow: 0 2px 8px rgba(220, 38, 38, 0.4) !important;
 }
 </style>
 """
 
 
 def inject_navigation_css() -> None:
-    """Inject navigation-related CSS styles."""
-    if 'navigation_css_injected' not in st.session_state:
-        st.markdown(NAVIGATION_CSS, unsafe_allow_html=True)
-        st.session_state.navigation_css_injected = True
\ No newline at end of file
+    """
+    Inject navigation-related CSS styles, including the reset button rules.
+
+    Emitted once per script run: Streamlit drops elements that are not
+    re-rendered, so a once-per-session guard loses the styles after a rerun.
+    """
+    st.markdown(NAVIGATION_CSS, unsafe_allow_html=True)
\ No newline at end of file
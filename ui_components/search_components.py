@@ -6,15 +6,78 @@ This module contains search-related UI components and functionality
 to handle SERP API search, results display, and article selection.
 """
 
+import html
+from collections import defaultdict
+
 import streamlit as st
-from tools.search_api import search_articles_serp, check_serp_api_status, validate_search_query
 from ui_components.navigation import show_returning_user_message
 
 
+# Search-result preview card; filled with format_map so absent fields render empty.
+# The optional date badge sits on the source line so an empty badge leaves no blank line.
+_PREVIEW_TPL = """
+<div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.9) 0%, rgba(16, 185, 129, 0.05) 100%);
+           border-radius: 12px;
+           padding: 1.5rem;
+           margin: 1rem 0;
+           border-left: 4px solid #10b981;
+           box-shadow: 0 4px 12px rgba(16, 185, 129, 0.1);">
+    <h4 style="color: #065f46; font-size: 1.2rem; font-weight: 700; margin-bottom: 0.75rem;">
+        📰 {title}
+    </h4>
+    <div style="margin-bottom: 0.5rem;">
+        <span style="background: #10b981; color: white; padding: 0.2rem 0.6rem; border-radius: 15px; font-size: 0.85rem; font-weight: 600; margin-right: 0.5rem;">
+            📡 {source}
+        </span>{date_html}
+        <span style="background: #3b82f6; color: white; padding: 0.2rem 0.6rem; border-radius: 15px; font-size: 0.85rem; font-weight: 600;">
+            🌐 {domain}
+        </span>
+    </div>
+    <p style="color: #374151; font-size: 1rem; line-height: 1.6; margin: 0.75rem 0;">
+        <strong>Summary:</strong> {snippet}
+    </p>
+    <div style="margin-top: 1rem; padding-top: 0.75rem; border-top: 1px solid rgba(16, 185, 129, 0.2);">
+        <a href="{link}" target="_blank" style="color: #10b981; text-decoration: none; font-weight: 600;">
+            🔗 View Original Article
+        </a>
+    </div>
+</div>
+"""
+
+_DATE_BADGE_TPL = '<span style="background: #6b7280; color: white; padding: 0.2rem 0.6rem; border-radius: 15px; font-size: 0.85rem; font-weight: 600; margin-right: 0.5rem;">📅 {date}</span>'
+
+
+class _SearchFailed(Exception):
+    """Carries an unsuccessful search response out of the cached search so it is not cached"""
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_search(query: str):
+    """Run a SERP search once per normalized query; successful results are reused for 10 minutes"""
+    from tools.search_api import search_articles_serp
+    results = search_articles_serp(query)
+    if isinstance(results, list) or (isinstance(results, dict) and results.get('status') == 'success'):
+        return results
+    raise _SearchFailed(results)
+
+
+def search_articles_cached(search_query: str):
+    """Search through the query cache, returning failed responses uncached"""
+    # Case and spacing differences should hit the same cache entry
+    query = " ".join(search_query.split()).lower()
+    try:
+        return _cached_search(query)
+    except _SearchFailed as e:
+        return e.args[0]
+
+
 def create_search_interface():
     """Create the search interface with API status and input form"""
     st.markdown("### 🔍 Search Articles with SERP API")
     
+    # Imported here so the search API client only loads once the search tab renders
+    from tools.search_api import check_serp_api_status
+    
     # Check SERP API status
     raw_api_status = check_serp_api_status()
     
@@ -74,17 +137,22 @@ def display_search_results(search_results: list):
         unsafe_allow_html=True
     )
     
-    # Create article options for radio button
-    article_options = []
-    for i, result in enumerate(search_results):
-        title_preview = result['title'][:60] + "..." if len(result['title']) > 60 else result['title']
-        article_options.append(f"{i+1}. {title_preview} - {result['source']}")
+    # Create article options for radio button; the labels are rebuilt only when a
+    # new results list arrives (identity check holds a reference, so ids can't be reused)
+    if st.session_state.get('_search_options_source') is not search_results:
+        article_options = []
+        for i, result in enumerate(search_results):
+            title_preview = result.get('title_preview') or result['title'][:60]
+            article_options.append(f"{i+1}. {title_preview} - {result['source']}")
+        st.session_state._search_options_source = search_results
+        st.session_state._search_options = article_options
+    article_options = st.session_state._search_options
     
     # Radio button selection
     selected_article_idx = st.radio(
         "Choose an article to analyze:",
         range(len(article_options)),
-        format_func=lambda x: article_options[x],
+        format_func=article_options.__getitem__,
         key="selected_search_article"
     )
     
@@ -106,43 +174,33 @@ def display_search_results(search_results: list):
     
     return None, None
 
+def _date_badge(date) -> str:
+    """Date badge for the preview card, or an empty string when the result has no date"""
+    return _DATE_BADGE_TPL.format(date=html.escape(str(date))) if date else ''
+
 def show_article_preview(article_result: dict):
     """Show preview of selected search result"""
-    st.markdown(
-        f"""
-        <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.9) 0%, rgba(16, 185, 129, 0.05) 100%);
-                   border-radius: 12px;
-                   padding: 1.5rem;
-                   margin: 1rem 0;
-                   border-left: 4px solid #10b981;
-                   box-shadow: 0 4px 12px rgba(16, 185, 129, 0.1);">
-            <h4 style="color: #065f46; font-size: 1.2rem; font-weight: 700; margin-bottom: 0.75rem;">
-                📰 {article_result['title']}
-            </h4>
-            <div style="margin-bottom: 0.5rem;">
-                <span style="background: #10b981; color: white; padding: 0.2rem 0.6rem; border-radius: 15px; font-size: 0.85rem; font-weight: 600; margin-right: 0.5rem;">
-                    📡 {article_result['source']}
-                </span>
-                {f'<span style="background: #6b7280; color: white; padding: 0.2rem 0.6rem; border-radius: 15px; font-size: 0.85rem; font-weight: 600; margin-right: 0.5rem;">📅 {article_result["date"]}</span>' if article_result.get('date') else ''}
-                <span style="background: #3b82f6; color: white; padding: 0.2rem 0.6rem; border-radius: 15px; font-size: 0.85rem; font-weight: 600;">
-                    🌐 {article_result.get('domain', 'N/A')}
-                </span>
-            </div>
-            <p style="color: #374151; font-size: 1rem; line-height: 1.6; margin: 0.75rem 0;">
-                <strong>Summary:</strong> {article_result['snippet']}
-            </p>
-            <div style="margin-top: 1rem; padding-top: 0.75rem; border-top: 1px solid rgba(16, 185, 129, 0.2);">
-                <a href="{article_result.get('link', article_result.get('url', '#'))}" target="_blank" style="color: #10b981; text-decoration: none; font-weight: 600;">
-                    🔗 View Original Article
-                </a>
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    fields = defaultdict(str, {
+        'title': html.escape(str(article_result.get('title', ''))),
+        'source': html.escape(str(article_result.get('source', ''))),
+        'date_html': _date_badge(article_result.get('date')),
+        'domain': html.escape(str(article_result.get('domain', 'N/A'))),
+        'snippet': html.escape(str(article_result.get('snippet', ''))),
+        'link': html.escape(article_result.get('link', article_result.get('url', '#')), quote=True)
+    })
+    st.markdown(_PREVIEW_TPL.format_map(fields), unsafe_allow_html=True)
+
+def _add_title_previews(results: list) -> list:
+    """Store each result's truncated display title once, when the results arrive"""
+    for result in results:
+        title = result['title']
+        result['title_preview'] = title[:60] + "..." if len(title) > 60 else title
+    return results
 
 def handle_search_process(search_query: str, api_status: dict):
     """Handle the search process and return results"""
+    from tools.search_api import validate_search_query
+    
     # First validate the search query
     if not validate_search_query(search_query):
         st.error("⚠️ Please enter a search query with at least 3 characters")
@@ -161,22 +219,22 @@ def handle_search_process(search_query: str, api_status: dict):
                 'domain': 'example.com'
             }
         ]
-        return mock_results
+        return _add_title_previews(mock_results)
     else:
         # Perform actual search
         with st.spinner("🔍 Searching for articles..."):
             try:
-                results = search_articles_serp(search_query)
+                results = search_articles_cached(search_query)
                 # Check if results is a list (direct search results)
                 if isinstance(results, list):
                     search_results = results
                     st.success(f"✅ Found {len(search_results)} articles")
-                    return search_results
+                    return _add_title_previews(search_results)
                 # Check if results is a dict (error or status response)
                 elif isinstance(results, dict) and results.get('status') == 'success':
                     search_results = results.get('articles', [])
                     st.success(f"✅ Found {len(search_results)} articles")
-                    return search_results
+                    return _add_title_previews(search_results)
                 else:
                     error_msg = results.get('message', 'Unknown error') if isinstance(results, dict) else "Unexpected response format"
                     st.error(f"❌ Search failed: {error_msg}")
@@ -185,12 +243,13 @@ def handle_search_process(search_query: str, api_status: dict):
                 st.error(f"❌ Search error: {str(e)}")
                 return []
 
+# Session-state keys that hold the current search and its selection
+_SEARCH_STATE_KEYS = ('search_results', 'last_search_query', 'selected_search_article')
+
 def create_new_search_button():
     """Create a button to start a new search"""
     if st.button("🔄 New Search", use_container_width=False):
         # Clear search-related session state
-        search_keys = ['search_results', 'last_search_query', 'selected_search_article']
-        for key in search_keys:
-            if key in st.session_state:
-                del st.session_state[key]
+        for key in _SEARCH_STATE_KEYS:
+            st.session_state.pop(key, None)
         st.rerun()
\ No newline at end of file
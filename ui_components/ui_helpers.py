@@ -41,223 +41,252 @@ METHOD_TAB_STYLES = {
     }
 }
 
+import html
 import json
+import logging
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
+from string import Template
 
-# Load sample articles from JSON file
+logger = logging.getLogger(__name__)
+
+# orjson is optional; parsing falls back to the stdlib json module
 try:
-    # Get the path to the JSON file
-    sample_articles_path = Path(__file__).parent.parent / "data" / "sample_articles.json"
-    
-    # Load articles from file
-    with open(sample_articles_path, 'r', encoding='utf-8') as file:
-        articles_data = json.load(file)
-        SAMPLE_ARTICLES = []
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# Location of the bundled sample articles, resolved once at import
+_SAMPLE_ARTICLES_PATH = Path(__file__).resolve().parent.parent / "data" / "sample_articles.json"
+
+@st.cache_data(show_spinner=False)
+def _load_sample_articles():
+    """Load sample articles from the JSON file, cached across reruns and sessions"""
+    try:
+        # Single read of the raw bytes; orjson parses them without a decode step
+        raw = _SAMPLE_ARTICLES_PATH.read_bytes()
+        articles_data = orjson.loads(raw) if HAVE_ORJSON else json.loads(raw)
+        articles = []
         # Process articles and ensure source field is set to "sample"
         for article in articles_data.get("articles", []):
             article["source"] = "sample"
-            SAMPLE_ARTICLES.append(article)
-except Exception as e:
-    # Fallback to default sample article if loading fails
-    print(f"Failed to load sample articles: {e}")
-    SAMPLE_ARTICLES = [
-        {
-            "title": "Climate Change: Latest Scientific Consensus (Sample)",
-            "content": "Recent studies from leading climate research institutions indicate that global temperatures have risen by 1.2°C since pre-industrial times. The Intergovernmental Panel on Climate Change (IPCC) reports unprecedented changes in Earth's climate system. Scientists have observed accelerating ice sheet loss in Greenland and Antarctica, with sea level rise of 3.4mm per year. Ocean acidification has increased by 30% since the Industrial Revolution. Extreme weather events, including hurricanes, droughts, and heatwaves, are becoming more frequent and intense. Carbon dioxide levels have reached 421 parts per million, the highest in over 3 million years. Renewable energy adoption has accelerated, with solar and wind now the cheapest forms of electricity in many regions.",
-            "source": "sample",
-            "domain": "Sample Climate Research Institute", 
-            "author": "Dr. Sarah Johnson, Climate Scientist",
-            "published_date": "March 15, 2024",
-        # Mock downstream tasks results
-        "mock_analysis": {
-            "summary": {
-                "summary": "This comprehensive climate change report highlights critical environmental indicators showing accelerating global warming. The article presents IPCC findings on temperature increases, ice sheet loss, and rising sea levels, while also noting positive developments in renewable energy adoption.",
-                "key_points": [
-                    "Global temperatures have increased by 1.2°C since pre-industrial times",
-                    "Sea level rise is occurring at 3.4mm per year with accelerating ice sheet loss",
-                    "Ocean acidification has increased 30% since Industrial Revolution",
-                    "Carbon dioxide levels are at highest point in 3 million years at 421 ppm",
-                    "Renewable energy has become cost-competitive with traditional sources"
-                ]
-            },
-            "context": {
-                "perspective": "The article presents a scientifically grounded, data-driven perspective on climate change impacts.",
-                "bias_indicators": ["Uses peer-reviewed scientific sources", "Presents factual data without political framing", "Includes both challenges and solutions"],
-                "historical_context": "This aligns with the IPCC AR6 report series and ongoing international climate negotiations under the Paris Agreement.",
-                "missing_context": "Could benefit from discussion of regional variations in climate impacts and socioeconomic implications."
-            },
-            "related_articles": [
-                {
-                    "title": "IPCC AR6 Working Group I Report: The Physical Science Basis",
-                    "source": "IPCC Publications",
-                    "date": "2021-08-09",
-                    "url": "https://ipcc.ch/report/ar6/wg1/",
-                    "relevance": "High",
-                    "perspective": "Supporting"
+            articles.append(article)
+        return articles
+    except Exception as e:
+        # Fallback to default sample article if loading fails
+        print(f"Failed to load sample articles: {e}")
+        return [
+            {
+                "title": "Climate Change: Latest Scientific Consensus (Sample)",
+                "content": "Recent studies from leading climate research institutions indicate that global temperatures have risen by 1.2°C since pre-industrial times. The Intergovernmental Panel on Climate Change (IPCC) reports unprecedented changes in Earth's climate system. Scientists have observed accelerating ice sheet loss in Greenland and Antarctica, with sea level rise of 3.4mm per year. Ocean acidification has increased by 30% since the Industrial Revolution. Extreme weather events, including hurricanes, droughts, and heatwaves, are becoming more frequent and intense. Carbon dioxide levels have reached 421 parts per million, the highest in over 3 million years. Renewable energy adoption has accelerated, with solar and wind now the cheapest forms of electricity in many regions.",
+                "source": "sample",
+                "domain": "Sample Climate Research Institute", 
+                "author": "Dr. Sarah Johnson, Climate Scientist",
+                "published_date": "March 15, 2024",
+            # Mock downstream tasks results
+            "mock_analysis": {
+                "summary": {
+                    "summary": "This comprehensive climate change report highlights critical environmental indicators showing accelerating global warming. The article presents IPCC findings on temperature increases, ice sheet loss, and rising sea levels, while also noting positive developments in renewable energy adoption.",
+                    "key_points": [
+                        "Global temperatures have increased by 1.2°C since pre-industrial times",
+                        "Sea level rise is occurring at 3.4mm per year with accelerating ice sheet loss",
+                        "Ocean acidification has increased 30% since Industrial Revolution",
+                        "Carbon dioxide levels are at highest point in 3 million years at 421 ppm",
+                        "Renewable energy has become cost-competitive with traditional sources"
+                    ]
                 },
-                {
-                    "title": "Global Carbon Budget 2023: Emissions Remain at Record High",
-                    "source": "Global Carbon Project",
-                    "date": "2023-12-05",
-                    "url": "https://globalcarbonproject.org/carbonbudget/",
-                    "relevance": "High",
-                    "perspective": "Corroborating"
-                }
-            ],
-            "fact_check": {
-                "overall_assessment": "Highly Accurate",
-                "claims": [
-                    {
-                        "claim": "Global temperatures have risen by 1.2°C since pre-industrial times",
-                        "assessment": "Accurate",
-                        "evidence": "Confirmed by NASA GISS, NOAA, and WMO temperature records. Latest data shows 1.15-1.2°C warming."
-                    },
+                "context": {
+                    "perspective": "The article presents a scientifically grounded, data-driven perspective on climate change impacts.",
+                    "bias_indicators": ["Uses peer-reviewed scientific sources", "Presents factual data without political framing", "Includes both challenges and solutions"],
+                    "historical_context": "This aligns with the IPCC AR6 report series and ongoing international climate negotiations under the Paris Agreement.",
+                    "missing_context": "Could benefit from discussion of regional variations in climate impacts and socioeconomic implications."
+                },
+                "related_articles": [
                     {
-                        "claim": "Sea level rise of 3.4mm per year",
-                        "assessment": "Accurate",
-                        "evidence": "NOAA satellite altimetry data confirms current rate of 3.4mm/year, with acceleration noted."
+                        "title": "IPCC AR6 Working Group I Report: The Physical Science Basis",
+                        "source": "IPCC Publications",
+                        "date": "2021-08-09",
+                        "url": "https://ipcc.ch/report/ar6/wg1/",
+                        "relevance": "High",
+                        "perspective": "Supporting"
                     },
                     {
-                        "claim": "Carbon dioxide levels at 421 parts per million",
-                        "assessment": "Accurate",
-                        "evidence": "Mauna Loa Observatory recorded CO2 levels exceeding 421 ppm in 2023-2024."
+                        "title": "Global Carbon Budget 2023: Emissions Remain at Record High",
+                        "source": "Global Carbon Project",
+                        "date": "2023-12-05",
+                        "url": "https://globalcarbonproject.org/carbonbudget/",
+                        "relevance": "High",
+                        "perspective": "Corroborating"
                     }
-                ]
+                ],
+                "fact_check": {
+                    "overall_assessment": "Highly Accurate",
+                    "claims": [
+                        {
+                            "claim": "Global temperatures have risen by 1.2°C since pre-industrial times",
+                            "assessment": "Accurate",
+                            "evidence": "Confirmed by NASA GISS, NOAA, and WMO temperature records. Latest data shows 1.15-1.2°C warming."
+                        },
+                        {
+                            "claim": "Sea level rise of 3.4mm per year",
+                            "assessment": "Accurate",
+                            "evidence": "NOAA satellite altimetry data confirms current rate of 3.4mm/year, with acceleration noted."
+                        },
+                        {
+                            "claim": "Carbon dioxide levels at 421 parts per million",
+                            "assessment": "Accurate",
+                            "evidence": "Mauna Loa Observatory recorded CO2 levels exceeding 421 ppm in 2023-2024."
+                        }
+                    ]
+                }
             }
-        }
-    },
-    {
-        "title": "AI Revolution in Healthcare: Transforming Medical Diagnosis (Sample)",
-        "content": "Artificial Intelligence is revolutionizing healthcare through advanced diagnostic capabilities. Machine learning algorithms can now detect cancer with 94% accuracy, surpassing human radiologists in some cases. AI-powered drug discovery has reduced development time from 10-15 years to 3-5 years. IBM Watson for Oncology analyzes patient data to recommend personalized treatment plans. Deep learning models process medical images to identify diseases like diabetic retinopathy and pneumonia. Natural Language Processing helps analyze clinical notes and research papers. Robotic surgery systems perform procedures with sub-millimeter precision. AI chatbots provide 24/7 patient support and preliminary health assessments.",
-        "source": "sample",
-        "domain": "Sample Medical Technology Review",
-        "author": "Dr. Michael Chen, Medical AI Researcher",
-        "published_date": "February 28, 2024",
-        # Mock downstream tasks results
-        "mock_analysis": {
-            "summary": {
-                "summary": "This article explores the transformative impact of AI in healthcare, covering diagnostic improvements, drug discovery acceleration, and various clinical applications. It highlights both current achievements and emerging technologies in medical AI.",
-                "key_points": [
-                    "AI achieves 94% accuracy in cancer detection, sometimes exceeding human performance",
-                    "Drug discovery timeline reduced from 10-15 years to 3-5 years using AI",
-                    "Multiple AI applications span imaging, NLP, robotics, and patient support",
-                    "Deep learning models successfully identify specific diseases from medical images",
-                    "AI systems provide personalized treatment recommendations and 24/7 support"
-                ]
-            },
-            "context": {
-                "perspective": "The article presents an optimistic view of AI in healthcare, emphasizing achievements and potential.",
-                "bias_indicators": ["Focuses primarily on positive outcomes", "Limited discussion of challenges or limitations", "Industry-focused perspective"],
-                "historical_context": "Reflects the rapid advancement of AI in healthcare following deep learning breakthroughs since 2012.",
-                "missing_context": "Could include discussion of regulatory challenges, data privacy concerns, and implementation barriers."
-            },
-            "related_articles": [
-                {
-                    "title": "FDA Approvals of AI/ML-Based Medical Devices",
-                    "source": "FDA Medical Device Database",
-                    "date": "2024-01-15",
-                    "url": "https://fda.gov/medical-devices/ai-ml",
-                    "relevance": "High",
-                    "perspective": "Regulatory"
+        },
+        {
+            "title": "AI Revolution in Healthcare: Transforming Medical Diagnosis (Sample)",
+            "content": "Artificial Intelligence is revolutionizing healthcare through advanced diagnostic capabilities. Machine learning algorithms can now detect cancer with 94% accuracy, surpassing human radiologists in some cases. AI-powered drug discovery has reduced development time from 10-15 years to 3-5 years. IBM Watson for Oncology analyzes patient data to recommend personalized treatment plans. Deep learning models process medical images to identify diseases like diabetic retinopathy and pneumonia. Natural Language Processing helps analyze clinical notes and research papers. Robotic surgery systems perform procedures with sub-millimeter precision. AI chatbots provide 24/7 patient support and preliminary health assessments.",
+            "source": "sample",
+            "domain": "Sample Medical Technology Review",
+            "author": "Dr. Michael Chen, Medical AI Researcher",
+            "published_date": "February 28, 2024",
+            # Mock downstream tasks results
+            "mock_analysis": {
+                "summary": {
+                    "summary": "This article explores the transformative impact of AI in healthcare, covering diagnostic improvements, drug discovery acceleration, and various clinical applications. It highlights both current achievements and emerging technologies in medical AI.",
+                    "key_points": [
+                        "AI achieves 94% accuracy in cancer detection, sometimes exceeding human performance",
+                        "Drug discovery timeline reduced from 10-15 years to 3-5 years using AI",
+                        "Multiple AI applications span imaging, NLP, robotics, and patient support",
+                        "Deep learning models successfully identify specific diseases from medical images",
+                        "AI systems provide personalized treatment recommendations and 24/7 support"
+                    ]
                 },
-                {
-                    "title": "Challenges in Clinical AI Implementation: A Systematic Review",
-                    "source": "Nature Medicine",
-                    "date": "2024-02-10",
-                    "url": "https://nature.com/articles/nm-ai-challenges",
-                    "relevance": "Medium",
-                    "perspective": "Critical"
-                }
-            ],
-            "fact_check": {
-                "overall_assessment": "Mostly Accurate with Some Generalizations",
-                "claims": [
-                    {
-                        "claim": "Machine learning algorithms detect cancer with 94% accuracy",
-                        "assessment": "Partially Accurate",
-                        "evidence": "Accuracy varies by cancer type and study. Some studies show 94%+ for specific cancers like skin cancer, but general claim needs context."
-                    },
+                "context": {
+                    "perspective": "The article presents an optimistic view of AI in healthcare, emphasizing achievements and potential.",
+                    "bias_indicators": ["Focuses primarily on positive outcomes", "Limited discussion of challenges or limitations", "Industry-focused perspective"],
+                    "historical_context": "Reflects the rapid advancement of AI in healthcare following deep learning breakthroughs since 2012.",
+                    "missing_context": "Could include discussion of regulatory challenges, data privacy concerns, and implementation barriers."
+                },
+                "related_articles": [
                     {
-                        "claim": "AI-powered drug discovery reduced development time from 10-15 years to 3-5 years",
-                        "assessment": "Optimistic Projection",
-                        "evidence": "AI shows promise in drug discovery but 3-5 year timeline is aspirational. Most AI-discovered drugs still in early trials."
+                        "title": "FDA Approvals of AI/ML-Based Medical Devices",
+                        "source": "FDA Medical Device Database",
+                        "date": "2024-01-15",
+                        "url": "https://fda.gov/medical-devices/ai-ml",
+                        "relevance": "High",
+                        "perspective": "Regulatory"
                     },
                     {
-                        "claim": "IBM Watson for Oncology analyzes patient data for treatment plans",
-                        "assessment": "Accurate but Outdated",
-                        "evidence": "IBM Watson for Oncology existed but faced criticism and was largely discontinued by major hospitals."
+                        "title": "Challenges in Clinical AI Implementation: A Systematic Review",
+                        "source": "Nature Medicine",
+                        "date": "2024-02-10",
+                        "url": "https://nature.com/articles/nm-ai-challenges",
+                        "relevance": "Medium",
+                        "perspective": "Critical"
                     }
-                ]
+                ],
+                "fact_check": {
+                    "overall_assessment": "Mostly Accurate with Some Generalizations",
+                    "claims": [
+                        {
+                            "claim": "Machine learning algorithms detect cancer with 94% accuracy",
+                            "assessment": "Partially Accurate",
+                            "evidence": "Accuracy varies by cancer type and study. Some studies show 94%+ for specific cancers like skin cancer, but general claim needs context."
+                        },
+                        {
+                            "claim": "AI-powered drug discovery reduced development time from 10-15 years to 3-5 years",
+                            "assessment": "Optimistic Projection",
+                            "evidence": "AI shows promise in drug discovery but 3-5 year timeline is aspirational. Most AI-discovered drugs still in early trials."
+                        },
+                        {
+                            "claim": "IBM Watson for Oncology analyzes patient data for treatment plans",
+                            "assessment": "Accurate but Outdated",
+                            "evidence": "IBM Watson for Oncology existed but faced criticism and was largely discontinued by major hospitals."
+                        }
+                    ]
+                }
             }
-        }
-    },
-    {
-        "title": "Quantum Computing Breakthrough: New Milestone Achieved (Sample)",
-        "content": "Researchers have achieved quantum supremacy with a 70-qubit quantum processor, solving complex problems impossible for classical computers. Google's quantum computer performed a specific calculation in 200 seconds that would take the world's fastest supercomputer 10,000 years. Quantum computers use quantum bits (qubits) that can exist in multiple states simultaneously through superposition. Quantum entanglement allows instant correlation between particles regardless of distance. Major tech companies including IBM, Microsoft, and Amazon are investing billions in quantum research. Applications include cryptography, drug discovery, financial modeling, and optimization problems. Quantum error correction remains a significant challenge for scaling up quantum systems.",
-        "source": "sample",
-        "domain": "Sample Quantum Research Lab",
-        "author": "Prof. Emily Rodriguez, Quantum Physicist",
-        "published_date": "January 10, 2024",
-        # Mock downstream tasks results
-        "mock_analysis": {
-            "summary": {
-                "summary": "This article reports on quantum computing advances, highlighting Google's quantum supremacy achievement and explaining fundamental quantum principles. It covers current research investments and both applications and challenges in the field.",
-                "key_points": [
-                    "Quantum supremacy achieved with 70-qubit processor solving problems impossible for classical computers",
-                    "Google's quantum computer completed calculation in 200 seconds vs 10,000 years for supercomputers",
-                    "Quantum mechanics principles of superposition and entanglement enable unique computational capabilities",
-                    "Major tech companies investing billions in quantum research and development",
-                    "Applications span cryptography, drug discovery, and complex optimization problems"
-                ]
-            },
-            "context": {
-                "perspective": "The article presents quantum computing achievements with technical optimism while acknowledging scaling challenges.",
-                "bias_indicators": ["Emphasizes breakthrough achievements", "Corporate investment focus", "Limited discussion of technical limitations"],
-                "historical_context": "Builds on decades of quantum physics research, with practical computing applications emerging since 2019.",
-                "missing_context": "Could expand on competing quantum computing approaches and realistic timelines for practical applications."
-            },
-            "related_articles": [
-                {
-                    "title": "Google Claims Quantum Supremacy with 54-Qubit Sycamore Processor",
-                    "source": "Nature",
-                    "date": "2019-10-23",
-                    "url": "https://nature.com/articles/s41586-019-1666-5",
-                    "relevance": "High",
-                    "perspective": "Historical Context"
+        },
+        {
+            "title": "Quantum Computing Breakthrough: New Milestone Achieved (Sample)",
+            "content": "Researchers have achieved quantum supremacy with a 70-qubit quantum processor, solving complex problems impossible for classical computers. Google's quantum computer performed a specific calculation in 200 seconds that would take the world's fastest supercomputer 10,000 years. Quantum computers use quantum bits (qubits) that can exist in multiple states simultaneously through superposition. Quantum entanglement allows instant correlation between particles regardless of distance. Major tech companies including IBM, Microsoft, and Amazon are investing billions in quantum research. Applications include cryptography, drug discovery, financial modeling, and optimization problems. Quantum error correction remains a significant challenge for scaling up quantum systems.",
+            "source": "sample",
+            "domain": "Sample Quantum Research Lab",
+            "author": "Prof. Emily Rodriguez, Quantum Physicist",
+            "published_date": "January 10, 2024",
+            # Mock downstream tasks results
+            "mock_analysis": {
+                "summary": {
+                    "summary": "This article reports on quantum computing advances, highlighting Google's quantum supremacy achievement and explaining fundamental quantum principles. It covers current research investments and both applications and challenges in the field.",
+                    "key_points": [
+                        "Quantum supremacy achieved with 70-qubit processor solving problems impossible for classical computers",
+                        "Google's quantum computer completed calculation in 200 seconds vs 10,000 years for supercomputers",
+                        "Quantum mechanics principles of superposition and entanglement enable unique computational capabilities",
+                        "Major tech companies investing billions in quantum research and development",
+                        "Applications span cryptography, drug discovery, and complex optimization problems"
+                    ]
                 },
-                {
-                    "title": "IBM's Quantum Network Reaches 200+ Members Milestone",
-                    "source": "IBM Research Blog",
-                    "date": "2024-01-05",
-                    "url": "https://research.ibm.com/quantum-network",
-                    "relevance": "Medium",
-                    "perspective": "Industry"
-                }
-            ],
-            "fact_check": {
-                "overall_assessment": "Accurate with Minor Technical Imprecision",
-                "claims": [
-                    {
-                        "claim": "Quantum supremacy achieved with 70-qubit quantum processor",
-                        "assessment": "Partially Accurate",
-                        "evidence": "Google's 2019 achievement used 53 qubits, not 70. IBM and others have since built larger systems but 'supremacy' claims are debated."
-                    },
+                "context": {
+                    "perspective": "The article presents quantum computing achievements with technical optimism while acknowledging scaling challenges.",
+                    "bias_indicators": ["Emphasizes breakthrough achievements", "Corporate investment focus", "Limited discussion of technical limitations"],
+                    "historical_context": "Builds on decades of quantum physics research, with practical computing applications emerging since 2019.",
+                    "missing_context": "Could expand on competing quantum computing approaches and realistic timelines for practical applications."
+                },
+                "related_articles": [
                     {
-                        "claim": "Calculation completed in 200 seconds vs 10,000 years for supercomputers",
-                        "assessment": "Accurate for Specific Problem",
-                        "evidence": "Google's 2019 Nature paper reports 200 seconds vs 10,000 years, though IBM disputed the classical computation estimate."
+                        "title": "Google Claims Quantum Supremacy with 54-Qubit Sycamore Processor",
+                        "source": "Nature",
+                        "date": "2019-10-23",
+                        "url": "https://nature.com/articles/s41586-019-1666-5",
+                        "relevance": "High",
+                        "perspective": "Historical Context"
                     },
                     {
-                        "claim": "Quantum entanglement allows instant correlation regardless of distance",
-                        "assessment": "Scientifically Accurate",
-                        "evidence": "Quantum entanglement is well-established phenomenon confirmed by numerous experiments, though doesn't enable faster-than-light communication."
+                        "title": "IBM's Quantum Network Reaches 200+ Members Milestone",
+                        "source": "IBM Research Blog",
+                        "date": "2024-01-05",
+                        "url": "https://research.ibm.com/quantum-network",
+                        "relevance": "Medium",
+                        "perspective": "Industry"
                     }
-                ]
+                ],
+                "fact_check": {
+                    "overall_assessment": "Accurate with Minor Technical Imprecision",
+                    "claims": [
+                        {
+                            "claim": "Quantum supremacy achieved with 70-qubit quantum processor",
+                            "assessment": "Partially Accurate",
+                            "evidence": "Google's 2019 achievement used 53 qubits, not 70. IBM and others have since built larger systems but 'supremacy' claims are debated."
+                        },
+                        {
+                            "claim": "Calculation completed in 200 seconds vs 10,000 years for supercomputers",
+                            "assessment": "Accurate for Specific Problem",
+                            "evidence": "Google's 2019 Nature paper reports 200 seconds vs 10,000 years, though IBM disputed the classical computation estimate."
+                        },
+                        {
+                            "claim": "Quantum entanglement allows instant correlation regardless of distance",
+                            "assessment": "Scientifically Accurate",
+                            "evidence": "Quantum entanglement is well-established phenomenon confirmed by numerous experiments, though doesn't enable faster-than-light communication."
+                        }
+                    ]
+                }
             }
         }
-    }
-]
+        ]
+
+def get_sample_articles():
+    """Return the sample article list (parsed once, then served from the cache)"""
+    return _load_sample_articles()
+
+@lru_cache(maxsize=1)
+def _sample_article_options():
+    """Dropdown labels for the sample selector, built on first use instead of on every rerun"""
+    return ("Select a sample article...",) + tuple(
+        f"{i+1}. {sample['title'][:50] + '...' if len(sample['title']) > 50 else sample['title']}"
+        for i, sample in enumerate(get_sample_articles())
+    )
 
 def inject_font_awesome():
     """Inject Font Awesome CSS if not already done"""
@@ -278,18 +307,19 @@ def create_method_tabs():
     ])
     return tabs
 
+_METHOD_DESCRIPTION_TPL = Template("""
+<div style="background: linear-gradient(135deg, rgba(102, 126, 234, 0.1) 0%, rgba(118, 75, 162, 0.1) 100%); border-radius: 10px; padding: 1rem; margin-bottom: 1.5rem; border-left: 4px solid #667eea;">
+    <p style="margin: 0; color: #4a5568; font-weight: 500;">
+        $icon $description
+    </p>
+</div>
+""")
+
 def show_method_description(method: str):
     """Show description for a specific method"""
     if method in METHOD_TAB_STYLES:
-        info = METHOD_TAB_STYLES[method]
         st.markdown(
-            f"""
-            <div style="background: linear-gradient(135deg, rgba(102, 126, 234, 0.1) 0%, rgba(118, 75, 162, 0.1) 100%); border-radius: 10px; padding: 1rem; margin-bottom: 1.5rem; border-left: 4px solid #667eea;">
-                <p style="margin: 0; color: #4a5568; font-weight: 500;">
-                    {info['icon']} {info['description']}
-                </p>
-            </div>
-            """,
+            _METHOD_DESCRIPTION_TPL.substitute(METHOD_TAB_STYLES[method]),
             unsafe_allow_html=True
         )
 
@@ -321,11 +351,8 @@ def create_sample_selector():
     """Create sample article selector with dropdown and fetch button"""
     st.markdown("### 🧪 Choose a Sample Article")
 
-    # Create dropdown options
-    dropdown_options = ["Select a sample article..."]
-    for i, sample in enumerate(SAMPLE_ARTICLES):
-        title_preview = sample['title'][:50] + "..." if len(sample['title']) > 50 else sample['title']
-        dropdown_options.append(f"{i+1}. {title_preview}")
+    # Dropdown options are built once per process
+    dropdown_options = _sample_article_options()
 
     selected_index = st.selectbox(
         "Select a sample article:",
@@ -386,229 +413,175 @@ def create_dataset_uploader():
 
     return uploaded_file, process_button, download_sample
 
+_NOTIFICATION_TPL = Template("""
+<div style="
+    background: rgba(255, 255, 255, 0.7);
+    padding: 1rem 1.5rem;
+    border-radius: 1rem;
+    border: 1px solid #d0d0d0;
+    box-shadow: 0 4px 10px rgba(0,0,0,0.1);
+    backdrop-filter: blur(6px);
+    margin-bottom: 1rem;
+">
+    <span style="font-size: 1.1rem; font-weight: bold;">$emoji $title</span><br>
+    <span style="font-size: 0.95rem;">$content</span>
+</div>
+""")
+
+@lru_cache(maxsize=128)
 def styled_notification(content: str, emoji: str = "", title: str = "Article Ready for Analysis!"):
-    """Create a reusable styled notification with frosted glass effect"""
-    return f"""
-    <div style="
-        background: rgba(255, 255, 255, 0.7);
-        padding: 1rem 1.5rem;
-        border-radius: 1rem;
-        border: 1px solid #d0d0d0;
-        box-shadow: 0 4px 10px rgba(0,0,0,0.1);
-        backdrop-filter: blur(6px);
-        margin-bottom: 1rem;
-    ">
-        <span style="font-size: 1.1rem; font-weight: bold;">{emoji} {title}</span><br>
-        <span style="font-size: 0.95rem;">{content}</span>
+    """Create a reusable styled notification with frosted glass effect (memoized; banners repeat across reruns)"""
+    return _NOTIFICATION_TPL.substitute(content=content, emoji=emoji, title=title)
+
+# Emoji shown for each article source in preview cards and the analysis header
+SOURCE_EMOJI = {
+    "sample": "🧪",
+    "url": "🌐",
+    "search_result": "🔍",
+    "uploaded_dataset": "📂"
+}
+
+# Preview card HTML skeletons, compiled once at import. Styling lives in the
+# .preview-card* / .preview-stat* / .preview-meta* rules of assets/styles.css
+_PREVIEW_HEADER_TPL = Template("""
+<div class="preview-card preview-card-top" style="padding-bottom: 0; margin-top: 2rem;">
+    <div class="preview-card-notice">
+        <span style="font-size: 1.1rem; font-weight: bold;">$source_emoji Article Ready for Analysis!</span><br>
+        <span style="font-size: 0.95rem;">✅ Successfully fetched from <b>$source_display</b></span>
     </div>
-    """
+    <h2 class="preview-card-title">$title</h2>
+    <h3 class="preview-card-heading">📄 Article Preview</h3>
+</div>
+""")
 
-def show_article_preview_card(article_data: dict):
-    """Show a detailed preview card for article data with content preview and metadata"""
-    source_emoji = {
-        "sample": "🧪",
-        "url": "🌐",
-        "search_result": "🔍",
-        "uploaded_dataset": "📂"
-    }.get(article_data.get("source", ""), "📄")
+_PREVIEW_BODY_TPL = Template("""<div class="preview-card preview-card-middle">$issues</div>
+""")
 
-    # Get article content and create preview
-    content = article_data.get('content', '')
+# Bottom edge of the content card followed by the metadata card header
+_PREVIEW_METADATA_OPEN_HTML = """<div class="preview-card preview-card-bottom"></div>
+<div class="preview-card preview-card-top">
+    <h3 class="preview-card-heading">📊 Article Metadata</h3>
+</div>
+"""
+
+_PREVIEW_STAT_TPL = Template("""<div class="preview-stat">
+    <div class="preview-stat-label">$label</div>
+    <div class="preview-stat-value">$value</div>
+</div>
+""")
+
+# Metadata card body: stats and details laid out on a two-column CSS grid
+# instead of three rounds of st.columns, followed by the card's bottom edge
+_PREVIEW_METADATA_TPL = Template("""<div class="preview-card preview-card-middle">
+    <div class="preview-meta-grid">
+$stats        <p>👤 <b>Author:</b> $author</p>
+        <p>📅 <b>Published:</b> $published_date</p>
+        <p>🏢 <b>Publisher:</b> $domain</p>
+        <p>📊 <b>Source Type:</b> $source_type</p>
+$url_row    </div>
+</div>
+<div class="preview-card preview-card-bottom"></div>
+""")
+
+_PREVIEW_URL_ROW_TPL = Template("""        <p class="preview-meta-url">🔗 <b>URL:</b> $url...</p>
+""")
 
-    # Content quality validation
+# Phrases that suggest the scraper picked up site navigation instead of article text
+_NAV_INDICATORS = ("see all topics follow", "subscribe now", "menu items", "follow us on", "social media")
+_NAV_RE = re.compile("|".join(map(re.escape, _NAV_INDICATORS)), re.IGNORECASE)
+
+@st.cache_data(show_spinner=False)
+def _preview_stats(content: str):
+    """Joined quality issues, preview text and counts for an article body, cached per content"""
     content_issues = []
     if len(content) < 100:
         content_issues.append("⚠️ Content appears very short")
     
-    content_lower = content.lower()
-    nav_indicators = ["see all topics follow", "subscribe now", "menu items", "follow us on", "social media"]
-    if any(indicator in content_lower for indicator in nav_indicators):
+    # One case-insensitive pass instead of lowercasing a copy and scanning once per phrase
+    if _NAV_RE.search(content):
         content_issues.append("⚠️ Content may contain navigation elements")
     
-    if content_issues:
-        content_preview = f"[Content Quality Issues: {'; '.join(content_issues)}]\n\n{content[:200]}..." if content else "No content available"
+    # Join once; the card's warning banner reuses the same string
+    issues_text = '; '.join(content_issues)
+    if issues_text:
+        content_preview = f"[Content Quality Issues: {issues_text}]\n\n{content[:200]}..."
     else:
         content_preview = content[:300] + "..." if len(content) > 300 else content
+    
+    return issues_text, content_preview, len(content), len(content.split())
+
+# Precomputed _preview_stats result for an empty body; skips the cache lookup
+_EMPTY_PREVIEW_STATS = ("⚠️ Content appears very short", "No content available", 0, 0)
+
+def show_article_preview_card(article_data: dict):
+    """Show a detailed preview card for article data with content preview and metadata"""
+    source_emoji = SOURCE_EMOJI.get(article_data.get("source", ""), "📄")
+
+    # Get article content and create preview
+    content = article_data.get('content') or ''
+    issues_text, content_preview, char_count, word_count = (
+        _preview_stats(content) if content else _EMPTY_PREVIEW_STATS
+    )
         
     title = article_data.get('title', 'Untitled Article')
     domain = article_data.get('domain', 'Unknown Source')
     author = article_data.get('author', 'Unknown Author')
     published_date = article_data.get('published_date', 'Unknown Date')
     
-    char_count = len(content)
-    word_count = len(content.split()) if content else 0
     source_display = article_data.get('original_source', domain)
 
     # CARD 1: Article content with success notification and preview - Using hybrid approach with HTML and Streamlit components
-    # Start with the container and notification
+    # Header, card body and any quality warning go out as one markdown element
+    issues_html = styled_notification(issues_text, "⚠️", "Content Quality Issues") if issues_text else ""
     st.markdown(
-        f"""
-        <div style="background: rgba(255, 255, 255, 0.7);
-                    border-radius: 1rem 1rem 0 0;
-                    padding: 1.5rem 1.5rem 0 1.5rem;
-                    margin: 2rem 0 0 0; 
-                    border: 1px solid #d0d0d0;
-                    border-bottom: none;
-                    box-shadow: 0 4px 10px rgba(0,0,0,0.1);
-                    backdrop-filter: blur(6px);">
-            <div style="background: rgba(255, 255, 255, 0.5);
-                        padding: 1rem 1.5rem;
-                        border-radius: 0.75rem;
-                        margin-bottom: 1.2rem;">
-                <span style="font-size: 1.1rem; font-weight: bold;">{source_emoji} Article Ready for Analysis!</span><br>
-                <span style="font-size: 0.95rem;">✅ Successfully fetched from <b>{source_display}</b></span>
-            </div>
-            <h2 style="text-align:center; margin-bottom:1.2rem; color:#333;">{title}</h2>
-            <h3 style="margin-top:0; margin-bottom:1rem;">📄 Article Preview</h3>
-        </div>
-        """,
+        _PREVIEW_HEADER_TPL.substitute(
+            source_emoji=source_emoji,
+            source_display=html.escape(str(source_display)),
+            title=html.escape(str(title))
+        ) + _PREVIEW_BODY_TPL.substitute(issues=issues_html),
         unsafe_allow_html=True
     )
     
-    # Use Streamlit components within the same visual card (continue the styling)
-    with st.container():
-        st.markdown(
-            """
-            <div style="background: rgba(255, 255, 255, 0.7);
-                        border-radius: 0;
-                        padding: 0 1.5rem;
-                        margin: 0; 
-                        border-left: 1px solid #d0d0d0;
-                        border-right: 1px solid #d0d0d0;">
-            """, 
-            unsafe_allow_html=True
-        )
-        
-        if content_issues:
-            st.markdown(
-                f"""
-                <div style="background: rgba(255, 255, 255, 0.7);
-                            padding: 1rem 1.5rem;
-                            border-radius: 1rem;
-                            border: 1px solid #d0d0d0;
-                            box-shadow: 0 4px 10px rgba(0,0,0,0.1);
-                            backdrop-filter: blur(6px);
-                            margin-bottom: 1rem;">
-                    <span style="font-size: 1.1rem; font-weight: bold;">⚠️ Content Quality Issues</span><br>
-                    <span style="font-size: 0.95rem;">{'; '.join(content_issues)}</span>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-        
-        with st.expander("View Content Preview", expanded=True):
-            st.markdown(f"{content_preview}")
-        
-        st.markdown(
-            """
-            <div style="background: rgba(255, 255, 255, 0.7);
-                        border-radius: 0 0 1rem 1rem;
-                        padding: 0.75rem 1.5rem 1.5rem 1.5rem;
-                        margin: 0 0 1.5rem 0; 
-                        border: 1px solid #d0d0d0;
-                        border-top: none;">
-            </div>
-            """, 
-            unsafe_allow_html=True
-        )
+    # The expander is a real widget, so it stays a separate element
+    with st.expander("View Content Preview", expanded=True):
+        st.markdown(f"{content_preview}")
     
-    # CARD 2: Metadata card with all details - Using Streamlit components for proper rendering
-    # Start with the card header
+    # CARD 2: Metadata card with all details
+    # Card 1's bottom edge, the metadata header and the metadata grid go out as one element
+    url = article_data.get('url')
+    url_row = _PREVIEW_URL_ROW_TPL.substitute(url=html.escape(url[:80])) if url else ""
     st.markdown(
-        """
-        <div style="background: rgba(255, 255, 255, 0.7);
-                    border-radius: 1rem 1rem 0 0;
-                    padding: 1.5rem 1.5rem 0.5rem 1.5rem;
-                    margin: 1.5rem 0 0 0; 
-                    border: 1px solid #d0d0d0;
-                    border-bottom: none;
-                    box-shadow: 0 4px 10px rgba(0,0,0,0.1);
-                    backdrop-filter: blur(6px);">
-            <h3 style="margin-top:0; margin-bottom:1rem;">📊 Article Metadata</h3>
-        </div>
-        """,
+        _PREVIEW_METADATA_OPEN_HTML + _PREVIEW_METADATA_TPL.substitute(
+            stats=(
+                _PREVIEW_STAT_TPL.substitute(label="🔢 Characters", value=f"{char_count:,}")
+                + _PREVIEW_STAT_TPL.substitute(label="🔤 Words", value=f"{word_count:,}")
+            ),
+            author=html.escape(str(author)),
+            published_date=html.escape(str(published_date)),
+            domain=html.escape(str(domain)),
+            source_type=html.escape(article_data.get('source', 'Unknown').replace('_', ' ').title()),
+            url_row=url_row
+        ),
         unsafe_allow_html=True
     )
-    
-    # Use a container for the metadata content with continued styling
-    with st.container():
-        st.markdown(
-            """
-            <div style="background: rgba(255, 255, 255, 0.7);
-                        padding: 0 1.5rem;
-                        margin: 0;
-                        border-left: 1px solid #d0d0d0;
-                        border-right: 1px solid #d0d0d0;
-                        backdrop-filter: blur(6px);">
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-        
-        # Character and Word count
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown(
-                f"""
-                <div style="background:rgba(255,255,255,0.5); 
-                            padding:1rem; border-radius:10px; 
-                            text-align:center; margin-bottom: 1rem;">
-                    <div style="color:#555; font-size:0.9rem;">🔢 Characters</div>
-                    <div style="font-size:1.5rem; font-weight:bold;">{char_count:,}</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-        
-        with col2:
-            st.markdown(
-                f"""
-                <div style="background:rgba(255,255,255,0.5); 
-                            padding:1rem; border-radius:10px; 
-                            text-align:center; margin-bottom: 1rem;">
-                    <div style="color:#555; font-size:0.9rem;">🔤 Words</div>
-                    <div style="font-size:1.5rem; font-weight:bold;">{word_count:,}</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-        
-        # Author and Published date
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown(f"👤 **Author:** {author}")
-        with col2:
-            st.markdown(f"📅 **Published:** {published_date}")
-        
-        # Publisher and Source Type
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown(f"🏢 **Publisher:** {domain}")
-        with col2:
-            st.markdown(f"📊 **Source Type:** {article_data.get('source', 'Unknown').replace('_', ' ').title()}")
-        
-        # URL if available
-        if article_data.get('url'):
-            st.markdown(f"🔗 **URL:** {article_data.get('url')[:80]}...")
-        
-        # Close the card with a bottom border
-        st.markdown(
-            """
-            <div style="background: rgba(255, 255, 255, 0.7);
-                        border-radius: 0 0 1rem 1rem;
-                        padding: 0.5rem 1.5rem 1.5rem 1.5rem;
-                        margin: 0 0 1.5rem 0; 
-                        border: 1px solid #d0d0d0;
-                        border-top: none;
-                        backdrop-filter: blur(6px);">
-            </div>
-            """, 
-            unsafe_allow_html=True
-        )
+
+@st.cache_resource(show_spinner=False)
+def _warm_pos_tagger():
+    """Load the shared perceptron tagger once per process so the first analysis doesn't pay for it"""
+    try:
+        # Same instance the patched pos_tag in claim extraction tags with
+        from utils.nltk_patches import get_perceptron_tagger
+        get_perceptron_tagger()
+        return True
+    except Exception as e:
+        # Missing NLTK data is handled by claim extraction's own fallbacks
+        logger.warning("NLTK tagger warm-up skipped: %s", e)
+        return False
 
 def show_analysis_start_button():
     """Show the analysis start button"""
+    # The button is shown while the user reads the preview; warm the tagger meanwhile
+    _warm_pos_tagger()
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
         return st.button(
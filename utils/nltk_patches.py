@@ -1,43 +1,133 @@
-
 """
 Monkey patches for NLTK compatibility issues
 """
 import logging
+from functools import lru_cache
 import nltk
-from nltk.tag import pos_tag as original_pos_tag
+from nltk.tag.mapping import map_tag
+from nltk.tag.perceptron import PerceptronTagger
 
 logger = logging.getLogger(__name__)
 
+# Keep a handle on NLTK's own (unpatched) pos_tag functions for callers that need
+# them; re-importing this module (e.g. on a Streamlit hot reload) reuses the stash
+# instead of capturing a previously applied patch
+original_pos_tag = getattr(nltk.tag, '_original_pos_tag', nltk.tag.pos_tag)
+nltk.tag._original_pos_tag = original_pos_tag
+original_pos_tag_sents = getattr(nltk.tag, '_original_pos_tag_sents', nltk.tag.pos_tag_sents)
+nltk.tag._original_pos_tag_sents = original_pos_tag_sents
+
+# Resource NLTK's default English tagger loads on first use
+_TAGGER_RESOURCE = 'taggers/averaged_perceptron_tagger_eng'
+
+def _tagger_available():
+    """Check whether the perceptron tagger resource is installed"""
+    try:
+        nltk.data.find(_TAGGER_RESOURCE)
+        return True
+    except LookupError:
+        return False
+
+@lru_cache(maxsize=1)
+def get_perceptron_tagger():
+    """
+    Load NLTK's English perceptron tagger once per process
+
+    nltk 3.9.1's pos_tag builds (and unpickles) a new PerceptronTagger on every
+    call, so the patched tagger holds a single shared instance instead.
+    """
+    return PerceptronTagger()
+
+def _perceptron_pos_tag(tokens, tagset=None):
+    """
+    Tag with the shared perceptron tagger, mapping tags like nltk's pos_tag does
+    """
+    tagged = get_perceptron_tagger().tag(tokens)
+    if tagset:
+        tagged = [(token, map_tag('en-ptb', tagset, tag)) for token, tag in tagged]
+    return tagged
+
+def _perceptron_pos_tag_sents(sentences, tagset=None):
+    """
+    Tag a batch of tokenized sentences with the shared perceptron tagger
+    """
+    return [_perceptron_pos_tag(sentence, tagset) for sentence in sentences]
+
+def _fallback_pos_tag(tokens, tagset=None):
+    """
+    Heuristic tagger used when the perceptron tagger resource is missing
+    """
+    try:
+        # Custom part-of-speech tagging implementation
+        # Simple heuristic: capitalized words are proper nouns (NNP), the rest regular nouns (NN)
+        return [
+            (token, 'NNP' if token and token[0].isupper() and token.isalpha() else 'NN')
+            for token in tokens
+        ]
+    except Exception as fallback_error:
+        logger.warning(f"Failed to use fallback tagger: {fallback_error}")
+        # Absolute basic fallback - all words are nouns
+        return [(token, 'NN') for token in tokens]
+
+def _fallback_pos_tag_sents(sentences, tagset=None):
+    """
+    Heuristic tagging for a batch of tokenized sentences
+    """
+    return [_fallback_pos_tag(sentence, tagset) for sentence in sentences]
+
+# Probe for the tagger once at import instead of catching LookupError on every call.
+# The result is fixed from then on: a tagger downloaded later in the same process is
+# only picked up after refresh_tagger() re-probes (claim extraction calls it after
+# its nltk.download step)
+_TAGGER_OK = _tagger_available()
+if not _TAGGER_OK:
+    logger.info("Detected incorrect tagger name reference, using custom tagging")
+_dispatch = _perceptron_pos_tag if _TAGGER_OK else _fallback_pos_tag
+_dispatch_sents = _perceptron_pos_tag_sents if _TAGGER_OK else _fallback_pos_tag_sents
+
+@lru_cache(maxsize=1024)
+def _cached_pos_tag(tokens, tagset):
+    """Tag a token tuple; memoized because reruns re-tag the same article text"""
+    return tuple(_dispatch(list(tokens), tagset=tagset))
+
 def patched_pos_tag(tokens, tagset=None, lang='eng'):
     """
     A wrapper for NLTK's pos_tag that handles resource naming issues
     """
-    try:
-        # Try with default parameters first
-        return original_pos_tag(tokens, tagset=tagset)
-    except LookupError as e:
-        error_msg = str(e)
-        if 'averaged_perceptron_tagger_eng' in error_msg:
-            # Try to download the correct resource
-            logger.info("Detected incorrect tagger name reference, using custom tagging")
-            try:
-                # Custom part-of-speech tagging implementation
-                result = []
-                for token in tokens:
-                    # Simple heuristic for proper nouns: capitalized words
-                    if token and len(token) > 0 and token[0].isupper() and token.isalpha():
-                        result.append((token, 'NNP'))  # Proper noun
-                    else:
-                        result.append((token, 'NN'))   # Regular noun
-                return result
-            except Exception as fallback_error:
-                logger.warning(f"Failed to use fallback tagger: {fallback_error}")
-                # Absolute basic fallback - all words are nouns
-                return [(token, 'NN') for token in tokens]
-        else:
-            # Re-raise if it's a different error
-            raise
-
-# Apply the monkey patch
+    # Fresh list per call so callers can't mutate the cached result
+    return list(_cached_pos_tag(tuple(tokens), tagset))
+
+patched_pos_tag.cache_clear = _cached_pos_tag.cache_clear
+patched_pos_tag._is_patched = True
+
+def patched_pos_tag_sents(sentences, tagset=None, lang='eng'):
+    """
+    Tag several tokenized sentences in one call with the shared tagger
+    """
+    # Sentences are tagged separately: the perceptron uses neighbouring words as
+    # features, so flattening them into one token list would change boundary tags
+    return _dispatch_sents(sentences, tagset=tagset)
+
+patched_pos_tag_sents._is_patched = True
+
+def refresh_tagger():
+    """
+    Re-probe for the tagger resource and rebind the dispatch, e.g. after nltk.download
+    """
+    global _TAGGER_OK, _dispatch, _dispatch_sents
+    _TAGGER_OK = _tagger_available()
+    _dispatch = _perceptron_pos_tag if _TAGGER_OK else _fallback_pos_tag
+    _dispatch_sents = _perceptron_pos_tag_sents if _TAGGER_OK else _fallback_pos_tag_sents
+    # Drop results tagged by the other backend
+    _cached_pos_tag.cache_clear()
+    return _TAGGER_OK
+
+# Apply the monkey patch (a reload replaces the old wrapper instead of stacking on it)
+already_patched = getattr(nltk.tag.pos_tag, '_is_patched', False)
 nltk.tag.pos_tag = patched_pos_tag
-logger.info("Applied NLTK pos_tag patch")
+nltk.tag.pos_tag_sents = patched_pos_tag_sents
+# nltk re-exports these at top level (keyword extraction calls nltk.pos_tag)
+nltk.pos_tag = patched_pos_tag
+nltk.pos_tag_sents = patched_pos_tag_sents
+if not already_patched:
+    logger.info("Applied NLTK pos_tag patch")